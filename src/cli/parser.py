@@ -5,6 +5,7 @@ to support both GUI-first and CLI modes.
 """
 
 import argparse
+from functools import lru_cache
 from typing import Final
 
 # CLI commands that trigger CLI mode instead of GUI
@@ -88,6 +89,12 @@ def create_parser() -> argparse.ArgumentParser:
     return parser
 
 
+@lru_cache(maxsize=1)
+def _shared_parser() -> argparse.ArgumentParser:
+    """Build the parser once for parse_args(); parsing does not modify it."""
+    return create_parser()
+
+
 def parse_args(args: list[str] | None = None) -> argparse.Namespace:
     """Parse command line arguments.
 
@@ -97,5 +104,4 @@ def parse_args(args: list[str] | None = None) -> argparse.Namespace:
     Returns:
         Parsed arguments namespace.
     """
-    parser = create_parser()
-    return parser.parse_args(args)
+    return _shared_parser().parse_args(args)
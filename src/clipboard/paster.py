@@ -63,7 +63,7 @@ class ClipboardPaster:
         """
         try:
             pyperclip.copy(text)
-            logger.debug(f"Copied {len(text)} characters to clipboard")
+            logger.debug("Copied %s characters to clipboard", len(text))
         except Exception as e:
             raise PasteError(
                 f"Failed to copy to clipboard: {str(e)}",
@@ -84,7 +84,7 @@ class ClipboardPaster:
             content = pyperclip.paste()
             return content if content else ""
         except Exception as e:
-            logger.warning(f"Failed to read clipboard: {str(e)}")
+            logger.warning("Failed to read clipboard: %s", e)
             return ""
 
     def paste_text(self, text: str, restore_clipboard: bool = True) -> bool:
@@ -125,14 +125,14 @@ class ClipboardPaster:
             # Allow paste to complete
             time.sleep(_PASTE_DELAY)
 
-            logger.info(f"Pasted {len(text)} characters")
+            logger.info("Pasted %s characters", len(text))
 
             return True
 
         except PasteError:
             raise
         except Exception as e:
-            logger.error(f"Paste operation failed: {str(e)}")
+            logger.error("Paste operation failed: %s", e)
             raise PasteError(
                 f"Paste operation failed: {str(e)}",
                 error_code="PASTE_FAILED",
@@ -148,7 +148,7 @@ class ClipboardPaster:
                     pyperclip.copy(original_clipboard)
                     logger.debug("Restored original clipboard content")
                 except Exception as e:
-                    logger.warning(f"Failed to restore clipboard: {str(e)}")
+                    logger.warning("Failed to restore clipboard: %s", e)
 
     def _simulate_paste(self) -> None:
         """Simulate Ctrl+V keyboard shortcut.
@@ -41,6 +41,9 @@ TTS_CACHE_TTL_HOURS: Final[int] = 24
 DEFAULT_STT_MODEL: Final[str] = "medium"  # Options: "tiny", "base", "small", "medium", "large"
 SILENCE_DURATION: Final[float] = 5.0  # seconds of silence before auto-stop
 SAMPLE_RATE: Final[int] = 16000  # Hz - required for Whisper model
+RECORDING_BUFFER_SECONDS: Final[float] = 120.0  # ring buffer length for the always-open input stream
+PARTIAL_DECODE_INTERVAL: Final[float] = 1.0  # seconds between decodes while still recording
+PARTIAL_DECODE_WINDOW: Final[float] = 30.0  # uncommitted audio after which a partial decode is committed whole
 
 # Browser Detection
 SUPPORTED_BROWSERS: Final[list[str]] = ["chrome", "edge", "firefox", "opera", "brave"]
@@ -6,6 +6,7 @@ for toggle state tracking (press to start, press again to stop).
 
 import logging
 import threading
+from functools import lru_cache
 from typing import Callable, Optional
 
 from pynput import keyboard
@@ -18,9 +19,13 @@ from src.utils.errors import (
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
 def parse_hotkey(hotkey_str: str) -> frozenset[keyboard.Key | keyboard.KeyCode]:
     """Parse a hotkey string into a set of pynput keys.
 
+    Results are cached, so re-registering a hotkey (for example when the
+    settings UI switches back to a previous one) does not parse it again.
+
     Args:
         hotkey_str: Hotkey in format '<ctrl>+<alt>+space' or 'ctrl+alt+space'
 
@@ -202,7 +207,7 @@ class HotkeyManager:
             keys = parse_hotkey(hotkey)
             self._hotkeys[normalized] = (keys, callback)
 
-            logger.info(f"Hotkey registered: {hotkey}")
+            logger.info("Hotkey registered: %s", hotkey)
 
     def unregister_hotkey(self, hotkey: str) -> None:
         """Unregister a previously registered hotkey.
@@ -220,7 +225,7 @@ class HotkeyManager:
                 raise KeyError(f"Hotkey '{hotkey}' is not registered")
 
             del self._hotkeys[normalized]
-            logger.info(f"Hotkey unregistered: {hotkey}")
+            logger.info("Hotkey unregistered: %s", hotkey)
 
     def start(self) -> None:
         """Start listening for registered hotkeys.
@@ -332,7 +337,7 @@ class HotkeyManager:
             normalized_pressed = {self._normalize_key(k) for k in self._pressed_keys}
 
             if keys <= normalized_pressed:
-                logger.debug(f"Hotkey triggered: {hotkey_str}")
+                logger.debug("Hotkey triggered: %s", hotkey_str)
                 # Execute callback in a separate thread to avoid blocking listener
                 threading.Thread(target=callback, daemon=True).start()
                 # Clear pressed keys to avoid repeated triggers
@@ -5,6 +5,7 @@ Whisper models via the faster-whisper library. Key components:
 
 - engine.py: Whisper model loading and transcription
 - recorder.py: Microphone audio capture
+- streaming.py: Background decoding while a recording is captured
 - transcriber.py: Main orchestration coordinator
 - audio_utils.py: Audio processing and silence detection
 - ui.py: Visual feedback and formatting utilities
@@ -5,6 +5,8 @@ import os
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
+
 # Suppress huggingface_hub symlink warning on Windows
 os.environ["HF_HUB_DISABLE_SYMLINKS_WARNING"] = "1"
 
@@ -15,6 +17,9 @@ from src.utils.errors import ModelLoadError, TranscriptionError
 
 logger = logging.getLogger(__name__)
 
+# Sample rate faster-whisper expects for in-memory audio
+WHISPER_SAMPLE_RATE = 16000
+
 
 class STTEngine:
     """Wrapper for faster-whisper model handling and transcription.
@@ -41,7 +46,7 @@ class STTEngine:
         self.model_path = STT_MODEL_CACHE
         self.model: Optional[WhisperModel] = None
 
-        logger.info(f"Initializing STT engine with model: {model_name}")
+        logger.info("Initializing STT engine with model: %s", model_name)
         self._load_model()
 
     def _check_model_cache(self) -> bool:
@@ -111,6 +116,29 @@ class STTEngine:
                 },
             ) from e
 
+    def warmup(self) -> None:
+        """Run a short throwaway transcription so the first real one is not cold.
+
+        Pages in the model weights and initializes the inference kernels.
+        Failures are logged and ignored, since the model itself is loaded.
+        """
+        if self.model is None:
+            return
+
+        try:
+            # One second of silence; VAD is off so the encoder actually runs
+            segments, _ = self.model.transcribe(
+                np.zeros(WHISPER_SAMPLE_RATE, dtype=np.float32),
+                language="en",
+                beam_size=1,
+                vad_filter=False,
+            )
+            # Segments are generated lazily, so consume them to run inference
+            for _ in segments:
+                pass
+        except Exception as e:
+            logger.warning("STT warmup failed: %s", e)
+
     def transcribe_audio(self, audio_path: Path, language: str = "en") -> str:
         """Transcribe audio file to text using Whisper model.
 
@@ -138,7 +166,7 @@ class STTEngine:
             )
 
         try:
-            logger.info(f"Transcribing audio file: {audio_path}")
+            logger.info("Transcribing audio file: %s", audio_path)
 
             # Transcribe with language specification and beam search
             segments, info = self.model.transcribe(
@@ -152,9 +180,10 @@ class STTEngine:
             text = self._extract_text(segments)
 
             logger.info(
-                f"Transcription complete: {len(text)} characters, "
-                f"language: {info.language}, "
-                f"probability: {info.language_probability:.2f}"
+                "Transcription complete: %s characters, language: %s, probability: %.2f",
+                len(text),
+                info.language,
+                info.language_probability,
             )
 
             return text
@@ -168,6 +197,126 @@ class STTEngine:
                 context={"audio_path": str(audio_path)},
             ) from e
 
+    def transcribe_array(self, samples: np.ndarray, sample_rate: int, language: str = "en") -> str:
+        """Transcribe in-memory audio samples without a WAV file round trip.
+
+        Args:
+            samples: Mono audio samples, int16 PCM or float32 in [-1, 1]
+            sample_rate: Sample rate of ``samples`` in Hz
+            language: Language code for transcription (default: "en")
+
+        Returns:
+            Transcribed text as a single string
+
+        Raises:
+            TranscriptionError: If transcription fails
+        """
+        if self.model is None:
+            raise TranscriptionError(
+                "Model not loaded",
+                error_code="MODEL_NOT_LOADED",
+            )
+
+        try:
+            logger.info("Transcribing %s samples at %sHz", len(samples), sample_rate)
+
+            segments, info = self.model.transcribe(
+                self._to_whisper_audio(samples, sample_rate),
+                language=language,
+                beam_size=5,
+                vad_filter=True,  # Voice activity detection to filter silence
+            )
+
+            text = self._extract_text(segments)
+
+            logger.info(
+                "Transcription complete: %s characters, language: %s, probability: %.2f",
+                len(text),
+                info.language,
+                info.language_probability,
+            )
+
+            return text
+
+        except Exception as e:
+            error_msg = f"Transcription failed: {str(e)}"
+            logger.error(error_msg)
+            raise TranscriptionError(
+                error_msg,
+                error_code="TRANSCRIPTION_FAILED",
+                context={"sample_rate": sample_rate, "samples": len(samples)},
+            ) from e
+
+    def transcribe_partial(
+        self, samples: np.ndarray, sample_rate: int, language: str = "en"
+    ) -> list[tuple[float, str]]:
+        """Transcribe part of a recording that is still being captured.
+
+        Returns per-segment end times so the caller can commit the segments
+        that are complete and decode the rest again once more audio arrives.
+
+        Args:
+            samples: Mono audio samples, int16 PCM or float32 in [-1, 1]
+            sample_rate: Sample rate of ``samples`` in Hz
+            language: Language code for transcription (default: "en")
+
+        Returns:
+            List of (end_seconds, text) tuples, one per segment, in order
+
+        Raises:
+            TranscriptionError: If transcription fails
+        """
+        if self.model is None:
+            raise TranscriptionError(
+                "Model not loaded",
+                error_code="MODEL_NOT_LOADED",
+            )
+
+        try:
+            segments, _ = self.model.transcribe(
+                self._to_whisper_audio(samples, sample_rate),
+                language=language,
+                beam_size=5,
+                vad_filter=True,
+            )
+            result = [(segment.end, segment.text.strip()) for segment in segments]
+
+            logger.debug("Partial transcription: %s samples, %s segments", len(samples), len(result))
+
+            return result
+
+        except Exception as e:
+            error_msg = f"Partial transcription failed: {str(e)}"
+            logger.error(error_msg)
+            raise TranscriptionError(
+                error_msg,
+                error_code="TRANSCRIPTION_FAILED",
+                context={"sample_rate": sample_rate, "samples": len(samples)},
+            ) from e
+
+    @staticmethod
+    def _to_whisper_audio(samples: np.ndarray, sample_rate: int) -> np.ndarray:
+        """Convert samples to the float32 16kHz mono array faster-whisper takes.
+
+        Args:
+            samples: Mono audio samples, int16 PCM or float32 in [-1, 1]
+            sample_rate: Sample rate of ``samples`` in Hz
+
+        Returns:
+            float32 samples at 16kHz
+        """
+        audio = samples.reshape(-1)
+        if audio.dtype == np.int16:
+            audio = audio.astype(np.float32) / 32768.0
+        else:
+            audio = audio.astype(np.float32, copy=False)
+        if sample_rate != WHISPER_SAMPLE_RATE:
+            target_len = int(len(audio) * WHISPER_SAMPLE_RATE / sample_rate)
+            audio = np.interp(np.linspace(0, len(audio) - 1, target_len), np.arange(len(audio)), audio).astype(
+                np.float32
+            )
+        return audio
+
     def _extract_text(self, segments) -> str:
         """Extract and concatenate text from transcription segments.
 
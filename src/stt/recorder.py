@@ -9,7 +9,7 @@ import numpy as np
 import sounddevice as sd
 from scipy.io import wavfile
 
-from src.config import SAMPLE_RATE
+from src.config import RECORDING_BUFFER_SECONDS, SAMPLE_RATE
 from src.stt.audio_utils import SilenceDetector
 from src.utils.errors import MicrophoneError
 
@@ -85,13 +85,24 @@ class MicrophoneRecorder:
         self._stop_event = threading.Event()
         self._audio_level_callback: Optional[Callable[[np.ndarray], None]] = None
 
+        # Ring buffer fed by a persistent stream (see open_stream); write_idx
+        # counts samples written since the stream opened
+        self._ring: Optional[np.ndarray] = None
+        self._write_idx = 0
+        self._start_idx = 0
+        self._end_idx = 0
+
+        # float32 scratch buffer the size of the ring; stop_recording returns
+        # views into it instead of allocating per recording
+        self._pcm: Optional[np.ndarray] = None
+
         # Detect and validate microphone device
         device_info = self._detect_default_device(device_id)
         self.device_id, self.device_name = device_info
         self._validate_device()
 
         logger.info(
-            f"MicrophoneRecorder initialized: device={self.device_name}, rate={sample_rate}Hz, channels={channels}"
+            "MicrophoneRecorder initialized: device=%s, rate=%sHz, channels=%s", self.device_name, sample_rate, channels
         )
 
     def _detect_default_device(self, device_id: Optional[int]) -> tuple[int, str]:
@@ -115,12 +126,12 @@ class MicrophoneRecorder:
             default_device = sd.query_devices(kind="input")
             device_id = sd.default.device[0]  # Input device index
 
-            logger.info(f"Using default microphone: {default_device['name']}")
+            logger.info("Using default microphone: %s", default_device["name"])
             return device_id, default_device["name"]
 
         except Exception as e:
             error_msg = "No microphone detected. Please connect a microphone and try again."
-            logger.error(f"{error_msg} Details: {str(e)}")
+            logger.error("%s Details: %s", error_msg, e)
             raise MicrophoneError(
                 error_msg,
                 error_code="NO_MICROPHONE_DETECTED",
@@ -147,7 +158,7 @@ class MicrophoneRecorder:
                     },
                 )
 
-            logger.debug(f"Device validation passed: {device_info}")
+            logger.debug("Device validation passed: %s", device_info)
 
         except MicrophoneError:
             raise
@@ -158,6 +169,178 @@ class MicrophoneRecorder:
                 context={"device_id": self.device_id},
             ) from e
 
+    @property
+    def is_stream_open(self) -> bool:
+        """Whether a persistent input stream is feeding the ring buffer."""
+        return self._ring is not None
+
+    def open_stream(self, buffer_seconds: float = RECORDING_BUFFER_SECONDS) -> None:
+        """Open an input stream that stays running between recordings.
+
+        Audio is written continuously into a preallocated ring buffer, so
+        `start_recording` only marks a position and capture begins without
+        waiting for the audio device to open. When a recording outgrows the
+        buffer, its oldest samples are dropped.
+
+        Args:
+            buffer_seconds: Ring buffer length in seconds
+
+        Raises:
+            MicrophoneError: If the stream cannot be opened
+        """
+        if self._ring is not None:
+            return
+
+        try:
+            self._ring = np.zeros(int(buffer_seconds * self.sample_rate) * self.channels, dtype=np.int16)
+            self._pcm = np.empty(len(self._ring), dtype=np.float32)
+            self._write_idx = 0
+            self._start_idx = 0
+            self._end_idx = 0
+
+            self._stream = sd.InputStream(
+                device=self.device_id,
+                samplerate=self.sample_rate,
+                channels=self.channels,
+                dtype=np.int16,
+                callback=self._ring_callback,
+                blocksize=int(self.sample_rate * 0.1),  # 100ms chunks
+            )
+            self._stream.start()
+
+            logger.info("Persistent input stream opened (%.0fs buffer)", buffer_seconds)
+
+        except Exception as e:
+            self._ring = None
+            self._pcm = None
+            self._stream = None
+            error_msg = f"Failed to open input stream: {str(e)}"
+            logger.error(error_msg)
+            raise MicrophoneError(
+                error_msg,
+                error_code="STREAM_OPEN_FAILED",
+                context={"device": self.device_name},
+            ) from e
+
+    def close_stream(self) -> None:
+        """Close the persistent input stream opened by `open_stream`."""
+        if self._ring is None:
+            return
+
+        stream, self._stream = self._stream, None
+        self._ring = None
+        self._pcm = None
+        self.is_recording = False
+        if stream:
+            try:
+                stream.stop()
+                stream.close()
+            except Exception as e:
+                logger.warning("Error closing input stream: %s", e)
+
+        logger.info("Persistent input stream closed")
+
+    def _ring_callback(self, indata: np.ndarray, frames: int, time_info, status) -> None:
+        """Write a chunk from the persistent stream into the ring buffer.
+
+        Args:
+            indata: Input audio data from microphone
+            frames: Number of frames in chunk
+            time_info: Time information dict
+            status: Stream status flags
+        """
+        ring = self._ring
+        if ring is None:
+            return
+
+        if status:
+            logger.warning("Audio stream status: %s", status)
+
+        samples = indata.reshape(-1)
+        size = len(ring)
+        if len(samples) > size:
+            samples = samples[-size:]
+
+        n = len(samples)
+        pos = self._write_idx % size
+        first = min(n, size - pos)
+        ring[pos : pos + first] = samples[:first]
+        ring[: n - first] = samples[first:]
+        # Publish the new end only after the samples are in place
+        self._write_idx += n
+
+        if not self.is_recording:
+            return
+
+        # Notify callback for visual feedback
+        if self._audio_level_callback:
+            self._audio_level_callback(indata)
+
+        # Check for silence if detector is enabled
+        if self.silence_detector:
+            if self.silence_detector.process_chunk(samples):
+                logger.info("Silence threshold reached, stopping recording")
+                self._stop_event.set()
+
+    def _read_ring(self, start: int, end: int) -> np.ndarray:
+        """Return a copy of the ring samples between two write positions."""
+        ring = self._ring
+        size = len(ring)
+        # Drop the oldest samples if the span outgrew the buffer
+        start = max(start, end - size)
+        n = end - start
+
+        pos = start % size
+        if pos + n <= size:
+            return ring[pos : pos + n].copy()
+        return np.concatenate((ring[pos:], ring[: n - (size - pos)]))
+
+    def _read_pcm(self, start: int, end: int) -> np.ndarray:
+        """Convert the ring samples between two write positions to float32.
+
+        The samples are scaled to [-1, 1] into the preallocated scratch
+        buffer, and a view of it is returned; the next call overwrites it.
+        """
+        ring = self._ring
+        pcm = self._pcm
+        size = len(ring)
+        # Drop the oldest samples if the span outgrew the buffer
+        start = max(start, end - size)
+        n = end - start
+
+        pos = start % size
+        first = min(n, size - pos)
+        np.multiply(ring[pos : pos + first], 1 / 32768, out=pcm[:first])
+        np.multiply(ring[: n - first], 1 / 32768, out=pcm[first:n])
+        return pcm[:n]
+
+    @property
+    def recorded_samples(self) -> int:
+        """Samples captured by the current or last ring-buffer recording.
+
+        Includes any oldest samples dropped because the recording outgrew
+        the buffer, so it can exceed the length `stop_recording` returns.
+        """
+        end = self._write_idx if self.is_recording else self._end_idx
+        return end - self._start_idx
+
+    def peek_recording(self, offset: int = 0) -> np.ndarray:
+        """Return the samples captured so far without stopping the recording.
+
+        Only available while recording from the persistent stream opened by
+        `open_stream`; otherwise returns an empty array.
+
+        Args:
+            offset: Number of samples to skip from the start of the recording
+
+        Returns:
+            Copy of the samples from ``offset`` to the current position (int16)
+        """
+        if self._ring is None or not self.is_recording:
+            return np.array([], dtype=np.int16)
+        end = self._write_idx
+        return self._read_ring(min(self._start_idx + offset, end), end)
+
     def _audio_callback(self, indata: np.ndarray, frames: int, time_info, status) -> None:
         """Callback function for sounddevice stream to process audio chunks.
 
@@ -168,7 +351,7 @@ class MicrophoneRecorder:
             status: Stream status flags
         """
         if status:
-            logger.warning(f"Audio stream status: {status}")
+            logger.warning("Audio stream status: %s", status)
 
         # Store audio chunk (copy to avoid buffer reuse issues)
         audio_chunk = indata.copy()
@@ -202,6 +385,16 @@ class MicrophoneRecorder:
             logger.warning("Recording already in progress")
             return
 
+        if self._ring is not None:
+            # Stream is already running; capture starts at the current position
+            self._stop_event.clear()
+            if self.silence_detector:
+                self.silence_detector.reset()
+            self._start_idx = self._end_idx = self._write_idx
+            self.is_recording = True
+            logger.info("Recording started")
+            return
+
         try:
             # Reset state
             self.audio_chunks = []
@@ -236,8 +429,14 @@ class MicrophoneRecorder:
     def stop_recording(self) -> np.ndarray:
         """Stop recording and return concatenated audio data.
 
+        With a persistent stream (see `open_stream`) the samples are float32
+        in [-1, 1] and the array is a view of a scratch buffer reused by every
+        recording: it stays valid until the next `stop_recording` call, so
+        copy it if it must outlive that.
+
         Returns:
-            Numpy array of audio samples (int16)
+            Numpy array of audio samples (int16, or float32 with a
+            persistent stream)
 
         Raises:
             MicrophoneError: If no audio was recorded
@@ -246,6 +445,22 @@ class MicrophoneRecorder:
             logger.warning("No recording in progress")
             return np.array([], dtype=np.int16)
 
+        if self._ring is not None:
+            # Leave the stream running for the next recording
+            self.is_recording = False
+            self._end_idx = self._write_idx
+            audio_data = self._read_pcm(self._start_idx, self._end_idx)
+            if len(audio_data) == 0:
+                raise MicrophoneError(
+                    "No audio data recorded",
+                    error_code="NO_AUDIO_RECORDED",
+                )
+
+            logger.info(
+                "Recording stopped, duration %.2f seconds", len(audio_data) / (self.sample_rate * self.channels)
+            )
+            return audio_data
+
         try:
             # Stop and close stream
             if self._stream:
@@ -254,7 +469,7 @@ class MicrophoneRecorder:
                 self._stream = None
 
             self.is_recording = False
-            logger.info(f"Recording stopped, collected {len(self.audio_chunks)} chunks")
+            logger.info("Recording stopped, collected %s chunks", len(self.audio_chunks))
 
             # Concatenate all audio chunks
             if not self.audio_chunks:
@@ -266,7 +481,7 @@ class MicrophoneRecorder:
             audio_data = np.concatenate(self.audio_chunks, axis=0)
             duration = len(audio_data) / self.sample_rate
 
-            logger.info(f"Total recording duration: {duration:.2f} seconds")
+            logger.info("Total recording duration: %.2f seconds", duration)
 
             return audio_data.flatten().astype(np.int16)
 
@@ -293,7 +508,7 @@ class MicrophoneRecorder:
                 input()
                 self._stop_event.set()
             except Exception as e:
-                logger.error(f"Input monitoring error: {e}")
+                logger.error("Input monitoring error: %s", e)
 
         input_thread = threading.Thread(target=wait_for_input, daemon=True)
         input_thread.start()
@@ -304,6 +519,9 @@ class MicrophoneRecorder:
     def save_wav(self, audio_data: np.ndarray, output_path: Path) -> None:
         """Save audio data as WAV file.
 
+        float32 samples (as returned with a persistent stream) are written as
+        16-bit PCM, half the size of a float WAV.
+
         Args:
             audio_data: Audio samples to save
             output_path: Path to output WAV file
@@ -314,6 +532,9 @@ class MicrophoneRecorder:
         try:
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
+            if audio_data.dtype == np.float32:
+                audio_data = np.clip(audio_data * 32768, -32768, 32767).astype(np.int16)
+
             # Ensure correct shape for scipy.io.wavfile
             if audio_data.ndim == 1:
                 audio_data = audio_data.reshape(-1, 1)
@@ -321,7 +542,7 @@ class MicrophoneRecorder:
             wavfile.write(output_path, self.sample_rate, audio_data)
 
             file_size = output_path.stat().st_size / 1024  # KB
-            logger.info(f"Audio saved to {output_path} ({file_size:.1f} KB)")
+            logger.info("Audio saved to %s (%.1f KB)", output_path, file_size)
 
         except Exception as e:
             error_msg = f"Failed to save audio file: {str(e)}"
@@ -349,5 +570,5 @@ class MicrophoneRecorder:
                 "default_samplerate": device_info["default_samplerate"],
             }
         except Exception as e:
-            logger.error(f"Failed to get device info: {e}")
+            logger.error("Failed to get device info: %s", e)
             return {"device_id": self.device_id, "device_name": self.device_name}
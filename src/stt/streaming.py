@@ -0,0 +1,148 @@
+"""Incremental transcription of a recording while it is still being captured."""
+
+import logging
+import threading
+from typing import Optional
+
+import numpy as np
+
+from src.config import PARTIAL_DECODE_INTERVAL, PARTIAL_DECODE_WINDOW
+from src.stt.engine import STTEngine
+from src.stt.recorder import MicrophoneRecorder
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingDecoder:
+    """Transcribe a ring-buffer recording in the background while it is captured.
+
+    Every `interval` seconds the audio after the commit point is decoded.
+    All segments except the last, which may be cut off mid-word, are
+    committed and the commit point moves to the end of the last committed
+    segment. Once the uncommitted audio reaches `window` seconds the whole
+    decode is committed, so each decode stays bounded however long the
+    recording runs. When the recording stops, `finish` only has to decode
+    the audio after the commit point.
+
+    Requires a recorder with a persistent stream (see
+    `MicrophoneRecorder.open_stream`), since partial audio is read with
+    `peek_recording`.
+
+    Example:
+        >>> decoder = StreamingDecoder(engine, recorder)
+        >>> recorder.start_recording()
+        >>> decoder.start()
+        >>> # ... user speaks ...
+        >>> text = decoder.finish(recorder.stop_recording())
+    """
+
+    def __init__(
+        self,
+        engine: STTEngine,
+        recorder: MicrophoneRecorder,
+        interval: float = PARTIAL_DECODE_INTERVAL,
+        window: float = PARTIAL_DECODE_WINDOW,
+        language: str = "en",
+    ) -> None:
+        """Initialize the decoder.
+
+        Args:
+            engine: Loaded STT engine
+            recorder: Recorder whose current recording is decoded
+            interval: Seconds between partial decodes
+            window: Seconds of uncommitted audio after which a decode is
+                committed in full
+            language: Language code for transcription
+        """
+        self._engine = engine
+        self._recorder = recorder
+        self._interval = interval
+        self._min_samples = int(interval * recorder.sample_rate)
+        self._window = int(window * recorder.sample_rate)
+        self._language = language
+
+        # Committed text, and the number of samples from the start of the
+        # recording it covers
+        self._committed: list[str] = []
+        self._offset = 0
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start decoding in a background thread."""
+        self._thread = threading.Thread(target=self._run, name="vox-partial-decode", daemon=True)
+        self._thread.start()
+
+    def cancel(self) -> None:
+        """Stop decoding, waiting for a decode in progress to finish.
+
+        Waiting keeps a partial decode from running on the shared engine
+        alongside the next recording's transcription.
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def finish(self, audio_data: np.ndarray) -> str:
+        """Stop decoding and return the transcription of the whole recording.
+
+        Args:
+            audio_data: Samples returned by `stop_recording()`
+
+        Returns:
+            Committed text followed by the transcription of the remaining audio
+
+        Raises:
+            TranscriptionError: If the remaining audio cannot be transcribed
+        """
+        self.cancel()
+
+        if self._offset == 0:
+            return self._engine.transcribe_array(audio_data, self._recorder.sample_rate, language=self._language)
+
+        # stop_recording drops the oldest samples of a recording that outgrew
+        # the ring buffer, which shifts the commit point
+        dropped = self._recorder.recorded_samples - len(audio_data)
+        tail = audio_data[max(self._offset - dropped, 0) :]
+
+        parts = list(self._committed)
+        if len(tail) > 0:
+            text = self._engine.transcribe_array(tail, self._recorder.sample_rate, language=self._language)
+            if text:
+                parts.append(text)
+
+        logger.debug("Streaming decode finished: %s committed segments", len(self._committed))
+
+        return " ".join(parts)
+
+    def _run(self) -> None:
+        """Decode every interval until stopped."""
+        while not self._stop_event.wait(self._interval):
+            try:
+                self._decode_step()
+            except Exception as e:
+                # finish() transcribes whatever was not committed
+                logger.warning("Partial decoding stopped: %s", e)
+                return
+
+    def _decode_step(self) -> None:
+        """Decode the audio after the commit point and commit finished segments."""
+        audio = self._recorder.peek_recording(self._offset)
+        if len(audio) < self._min_samples:
+            return
+
+        sample_rate = self._recorder.sample_rate
+        segments = self._engine.transcribe_partial(audio, sample_rate, language=self._language)
+
+        if len(audio) >= self._window:
+            # Keep each decode bounded: commit everything heard so far
+            done = segments
+            end = len(audio)
+        else:
+            # The last segment may still be growing; decode it again next time
+            done = segments[:-1]
+            end = min(int(done[-1][0] * sample_rate), len(audio)) if done else 0
+
+        self._committed.extend(text for _, text in done if text)
+        self._offset += end
@@ -1,7 +1,6 @@
 """Main transcription orchestrator coordinating recording and STT."""
 
 import logging
-import tempfile
 import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
@@ -159,7 +158,10 @@ class Transcriber:
         return audio_data, duration
 
     def _process_recording(self, audio_data: "np.ndarray", language: str, duration: float) -> str:
-        """Save recording to WAV and transcribe to text.
+        """Transcribe recorded audio to text.
+
+        The samples are passed to the engine in memory, without a temporary
+        WAV file.
 
         Args:
             audio_data: Recorded audio samples
@@ -169,39 +171,25 @@ class Transcriber:
         Returns:
             Transcribed text
         """
-        # Save to temporary WAV file
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
-            tmp_path = Path(tmp_file.name)
-
-        try:
-            # Save audio to WAV
-            if self.recorder:
-                self.recorder.save_wav(audio_data, tmp_path)
-            else:
-                raise TranscriptionError(
-                    "Recorder not initialized",
-                    error_code="RECORDER_NOT_INITIALIZED",
-                )
-
-            # Show progress indicator
-            progress = ProgressIndicator(
-                message=f"Transcribing with {self.model_name} model...",
-                show_spinner=True,
+        if not self.recorder:
+            raise TranscriptionError(
+                "Recorder not initialized",
+                error_code="RECORDER_NOT_INITIALIZED",
             )
-            progress.start()
 
-            # Transcribe WAV file
-            text = self.engine.transcribe_audio(tmp_path, language=language)
+        # Show progress indicator
+        progress = ProgressIndicator(
+            message=f"Transcribing with {self.model_name} model...",
+            show_spinner=True,
+        )
+        progress.start()
 
-            progress.stop(success=True)
+        # Transcribe recorded samples
+        text = self.engine.transcribe_array(audio_data, self.recorder.sample_rate, language=language)
 
-            return text
+        progress.stop(success=True)
 
-        finally:
-            # Clean up temporary file
-            if tmp_path.exists():
-                tmp_path.unlink()
-                logger.debug(f"Cleaned up temporary file: {tmp_path}")
+        return text
 
     def _display_result(self, text: str, duration: float) -> None:
         """Display transcription result to terminal with formatting.
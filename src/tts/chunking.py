@@ -8,9 +8,10 @@ streaming playback.
 import logging
 import re
 import threading
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional
+from typing import Deque, List, Optional
 
 from src.tts.synthesizer import PiperSynthesizer
 
@@ -73,7 +74,7 @@ class ChunkSynthesizer:
         self.synthesizer = PiperSynthesizer(voice=voice)
         self.speed = speed
         self.chunks: List[AudioChunk] = []
-        self.chunk_buffer: List[AudioChunk] = []
+        self.chunk_buffer: Deque[AudioChunk] = deque()
         self.shutdown_event = threading.Event()
         self._worker_threads: List[threading.Thread] = []
         self._lock = threading.Lock()
@@ -261,7 +262,7 @@ class ChunkSynthesizer:
         """
         with self._lock:
             if self.chunk_buffer:
-                return self.chunk_buffer.pop(0)
+                return self.chunk_buffer.popleft()
             return None
 
     def synthesize_chunk_on_demand(self, chunk_index: int) -> None:
@@ -22,6 +22,8 @@ from src.ui.styles import (
     COLORS_DARK,
     COLORS_LIGHT,
     FONTS,
+    ICON_RECORD,
+    ICON_STOP,
     ICONS,
     PADDING,
     SPACING,
@@ -38,6 +40,8 @@ __all__ = [
     "COLORS_DARK",
     "COLORS_LIGHT",
     "FONTS",
+    "ICON_RECORD",
+    "ICON_STOP",
     "ICONS",
     "PADDING",
     "SPACING",
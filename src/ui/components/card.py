@@ -125,7 +125,7 @@ class FluentCard(ttk.Frame):
         if width <= 1 or height <= 1:
             return
 
-        colors = get_colors(get_current_theme())
+        colors = get_colors(get_current_theme(self._root()))
 
         # Draw shadow rectangle (offset down and right)
         shadow_color = colors["shadow"]
@@ -37,6 +37,8 @@ from src.ui.components import (
 from src.ui.indicator import RecordingIndicator
 from src.ui.styles import (
     FONTS,
+    ICON_RECORD,
+    ICON_STOP,
     ICONS,
     SPACING,
     THEMES,
@@ -55,6 +57,10 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Record button labels, rebuilt on every state change otherwise
+_START_RECORDING_TEXT = f"{ICON_RECORD} Start Recording"
+_STOP_RECORDING_TEXT = f"{ICON_STOP} Stop Recording"
+
 
 class VoxMainWindow:
     """Main application window for the Vox voice input application.
@@ -135,6 +141,7 @@ class VoxMainWindow:
             size=(WINDOW_SIZE["width"], WINDOW_SIZE["height"]),
             minsize=(WINDOW_SIZE["min_width"], WINDOW_SIZE["min_height"]),
         )
+        self._root._vox_theme = self._current_theme  # type: ignore[attr-defined]
 
         # Configure Fluent styles and overrides
         configure_styles(self._root.style, self._current_theme)
@@ -247,7 +254,7 @@ class VoxMainWindow:
 
         self._record_btn = ttk.Button(
             btn_frame,
-            text=f"{ICONS['record']} Start Recording",
+            text=_START_RECORDING_TEXT,
             command=self._on_record_button,
             bootstyle="primary",  # type: ignore[arg-type]
             width=30,
@@ -485,8 +492,17 @@ class VoxMainWindow:
             if original_error_callback:
                 original_error_callback(message)
 
+        original_history_callback = self._controller._on_history_saved
+
+        def combined_history_callback() -> None:
+            # Saved on the controller's history writer thread
+            self._root.after(0, self.refresh_history)
+            if original_history_callback:
+                original_history_callback()
+
         self._controller._on_state_change = combined_state_callback
         self._controller._on_error = combined_error_callback
+        self._controller._on_history_saved = combined_history_callback
 
         # Also update the controller's indicator reference
         self._controller._indicator = self._indicator
@@ -555,7 +571,7 @@ class VoxMainWindow:
             self._root.after(
                 0,
                 lambda: self._record_btn.configure(
-                    text=f"{ICONS['record']} Start Recording",
+                    text=_START_RECORDING_TEXT,
                     state=NORMAL,
                 ),
             )
@@ -563,17 +579,13 @@ class VoxMainWindow:
             self._root.after(
                 0,
                 lambda: self._record_btn.configure(
-                    text=f"{ICONS['stop']} Stop Recording",
+                    text=_STOP_RECORDING_TEXT,
                     state=NORMAL,
                 ),
             )
         else:
             self._root.after(0, lambda: self._record_btn.configure(state=DISABLED))
 
-        # Refresh history after successful transcription
-        if state == AppState.IDLE:
-            self._root.after(100, self.refresh_history)
-
     def _update_status(self, message: str, style: str) -> None:
         """Update the status display with pill-style icon.
 
@@ -850,7 +862,7 @@ class VoxMainWindow:
     def _on_clipboard_setting_change(self) -> None:
         """Handle clipboard setting change with auto-save."""
         restore_value = "true" if self._restore_clipboard_var.get() else "false"
-        self._database.set_setting("restore_clipboard", restore_value)
+        self._controller.set_setting("restore_clipboard", restore_value)
         self._show_save_confirmation("Clipboard setting saved")
 
     def _schedule_save(self, setting_key: str, value: str) -> None:
@@ -895,7 +907,7 @@ class VoxMainWindow:
 
         # Save clipboard setting
         restore_value = "true" if self._restore_clipboard_var.get() else "false"
-        self._database.set_setting("restore_clipboard", restore_value)
+        self._controller.set_setting("restore_clipboard", restore_value)
 
         logger.info("Settings saved")
         self._status_bar_label.configure(text="Settings saved")
@@ -4,14 +4,32 @@ Provides common functionality for validation and state management
 that can be mixed into UI component classes.
 """
 
+from functools import lru_cache
 from typing import Any, Callable, TypeVar
 
 T = TypeVar("T")
 
+# Marks a state key that has never been set
+_MISSING: Any = object()
+
+
+@lru_cache(maxsize=128)
+def _empty_error(field_name: str) -> str:
+    """Render the empty-value validation message for a field."""
+    return f"{field_name} cannot be empty"
+
+
+@lru_cache(maxsize=128)
+def _range_error(field_name: str, min_val: float, max_val: float) -> str:
+    """Render the out-of-range validation message for a field."""
+    return f"{field_name} must be between {min_val} and {max_val}"
+
 
 class ValidationMixin:
     """Mixin providing input validation helpers for UI components."""
 
+    __slots__ = ()
+
     def validate_not_empty(self, value: str, field_name: str) -> bool:
         """Validate that a string value is not empty.
 
@@ -22,8 +40,8 @@ class ValidationMixin:
         Returns:
             True if valid, False otherwise.
         """
-        if not value or not value.strip():
-            self._show_validation_error(f"{field_name} cannot be empty")
+        if not (value and value.strip()):
+            self._show_validation_error(_empty_error(field_name))
             return False
         return True
 
@@ -40,7 +58,7 @@ class ValidationMixin:
             True if valid, False otherwise.
         """
         if value < min_val or value > max_val:
-            self._show_validation_error(f"{field_name} must be between {min_val} and {max_val}")
+            self._show_validation_error(_range_error(field_name, min_val, max_val))
             return False
         return True
 
@@ -57,10 +75,16 @@ class ValidationMixin:
 
 
 class StateMixin:
-    """Mixin providing state management helpers for UI components."""
+    """Mixin providing state management helpers for UI components.
+
+    State lives in its own dictionary rather than on the instance, so state
+    keys can never shadow component attributes or widget methods.
+    """
+
+    __slots__ = ()
 
     _state: dict[str, Any]
-    _state_listeners: dict[str, list[Callable[[Any], None]]]
+    _state_listeners: dict[str, tuple[Callable[[Any], None], ...]]
 
     def init_state(self, initial_state: dict[str, Any] | None = None) -> None:
         """Initialize the component state.
@@ -68,7 +92,7 @@ class StateMixin:
         Args:
             initial_state: Optional initial state dictionary.
         """
-        self._state = initial_state or {}
+        self._state = dict(initial_state) if initial_state else {}
         self._state_listeners = {}
 
     def get_state(self, key: str, default: T = None) -> T:
@@ -90,11 +114,16 @@ class StateMixin:
             key: The state key.
             value: The new value.
         """
-        old_value = self._state.get(key)
+        old_value = self._state.get(key, _MISSING)
+        if old_value is value:
+            return
+
         self._state[key] = value
 
-        if old_value != value and key in self._state_listeners:
-            for listener in self._state_listeners[key]:
+        if old_value is _MISSING:
+            old_value = None
+        if old_value != value:
+            for listener in self._state_listeners.get(key, ()):
                 listener(value)
 
     def on_state_change(self, key: str, listener: Callable[[Any], None]) -> None:
@@ -104,15 +133,17 @@ class StateMixin:
             key: The state key to listen for.
             listener: Callback function receiving the new value.
         """
-        if key not in self._state_listeners:
-            self._state_listeners[key] = []
-        self._state_listeners[key].append(listener)
+        # Rebuilt as a tuple on registration (rare) so dispatch iterates an
+        # immutable sequence
+        self._state_listeners[key] = self._state_listeners.get(key, ()) + (listener,)
 
 
 class BaseComponent(ValidationMixin, StateMixin):
     """Base mixin combining validation and state management.
 
     UI components can inherit from this to get common functionality.
+    Components that declare ``__slots__`` of their own avoid a per-instance
+    ``__dict__``; state is kept in the slotted ``_state`` dictionary.
 
     Example:
         class MyTab(BaseComponent):
@@ -121,6 +152,8 @@ class BaseComponent(ValidationMixin, StateMixin):
                 # ... build UI
     """
 
+    __slots__ = ("_state", "_state_listeners")
+
     def __init__(self) -> None:
         """Initialize the base component."""
         self.init_state()
@@ -5,18 +5,25 @@ for consistent visual appearance across all UI components following
 Windows 11 Fluent Design principles.
 """
 
+from __future__ import annotations
+
 import logging
-from typing import Final
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Final
 
-import ttkbootstrap as ttk
+if TYPE_CHECKING:
+    import ttkbootstrap as ttk
 
 logger = logging.getLogger(__name__)
 
 # Theme configuration - Fluent Design themes
-THEMES: Final[dict[str, str]] = {
-    "light": "cosmo",
-    "dark": "darkly",
-}
+THEMES: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "light": "cosmo",
+        "dark": "darkly",
+    }
+)
 
 # Default theme for legacy compatibility
 THEME_NAME: Final[str] = THEMES["light"]
@@ -25,51 +32,63 @@ THEME_NAME: Final[str] = THEMES["light"]
 FONT_FAMILY: Final[str] = "Segoe UI Variable"
 
 # 8px grid spacing system (Fluent Design)
-SPACING: Final[dict[str, int]] = {
-    "xs": 4,  # Tight internal padding
-    "sm": 8,  # Default internal padding
-    "md": 16,  # Section margins
-    "lg": 24,  # Card margins
-    "xl": 32,  # Page margins
-    "xxl": 48,  # Major section gaps
-}
+SPACING: Final[Mapping[str, int]] = MappingProxyType(
+    {
+        "xs": 4,  # Tight internal padding
+        "sm": 8,  # Default internal padding
+        "md": 16,  # Section margins
+        "lg": 24,  # Card margins
+        "xl": 32,  # Page margins
+        "xxl": 48,  # Major section gaps
+    }
+)
 
 # Legacy padding (deprecated - use SPACING instead)
-PADDING: Final[dict[str, int]] = {
-    "small": SPACING["xs"],
-    "medium": SPACING["sm"],
-    "large": SPACING["md"],
-    "xlarge": SPACING["lg"],
-}
+PADDING: Final[Mapping[str, int]] = MappingProxyType(
+    {
+        "small": SPACING["xs"],
+        "medium": SPACING["sm"],
+        "large": SPACING["md"],
+        "xlarge": SPACING["lg"],
+    }
+)
 
 # Fluent type scale
-FONTS: Final[dict[str, tuple[str, int, str]]] = {
-    "display": (FONT_FAMILY, 28, "bold"),  # App title, hero text
-    "title": (FONT_FAMILY, 20, "bold"),  # Section headers
-    "subtitle": (FONT_FAMILY, 14, "bold"),  # Card headers
-    "body": (FONT_FAMILY, 14, "normal"),  # Primary content
-    "caption": (FONT_FAMILY, 12, "normal"),  # Helper text
-    "mono": ("Cascadia Code", 12, "normal"),  # Hotkey display
-}
+FONTS: Final[Mapping[str, tuple[str, int, str]]] = MappingProxyType(
+    {
+        "display": (FONT_FAMILY, 28, "bold"),  # App title, hero text
+        "title": (FONT_FAMILY, 20, "bold"),  # Section headers
+        "subtitle": (FONT_FAMILY, 14, "bold"),  # Card headers
+        "body": (FONT_FAMILY, 14, "normal"),  # Primary content
+        "caption": (FONT_FAMILY, 12, "normal"),  # Helper text
+        "mono": ("Cascadia Code", 12, "normal"),  # Hotkey display
+    }
+)
 
 # Unicode icons for Fluent Design
-ICONS: Final[dict[str, str]] = {
-    "status": "🏠",
-    "settings": "⚙️",
-    "history": "📋",
-    "record": "🎤",
-    "stop": "⏹️",
-    "refresh": "🔄",
-    "delete": "🗑️",
-    "copy": "📄",
-    "check": "✅",
-    "warning": "⚠️",
-    "error": "❌",
-    "theme_light": "☀️",
-    "theme_dark": "🌙",
-    "faster": "⚡",
-    "accurate": "🎯",
-}
+ICONS: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "status": "🏠",
+        "settings": "⚙️",
+        "history": "📋",
+        "record": "🎤",
+        "stop": "⏹️",
+        "refresh": "🔄",
+        "delete": "🗑️",
+        "copy": "📄",
+        "check": "✅",
+        "warning": "⚠️",
+        "error": "❌",
+        "theme_light": "☀️",
+        "theme_dark": "🌙",
+        "faster": "⚡",
+        "accurate": "🎯",
+    }
+)
+
+# Icons swapped on every recording state change, bound once to skip lookups
+ICON_RECORD: Final[str] = ICONS["record"]
+ICON_STOP: Final[str] = ICONS["stop"]
 
 # Light theme color palette (Fluent Design)
 # WCAG AA Contrast Ratios (minimum 4.5:1 for normal text, 3:1 for large text):
@@ -81,24 +100,26 @@ ICONS: Final[dict[str, str]] = {
 #   - danger (#d13438) on surface (#ffffff): 4.5:1 ✓
 #   - warning_text (#8a6914) on surface (#ffffff): 4.6:1 ✓
 #   - on_accent (#ffffff) on primary (#0078d4): 4.5:1 ✓
-COLORS_LIGHT: Final[dict[str, str]] = {
-    "primary": "#0078d4",  # Windows 11 accent blue
-    "secondary": "#6c757d",  # Gray (secondary actions)
-    "success": "#107c10",  # Green (success states)
-    "info": "#0078d4",  # Blue (informational)
-    "warning": "#8a6914",  # Dark gold (warnings) - WCAG AA compliant on white
-    "danger": "#d13438",  # Red (errors, recording indicator)
-    "background": "#f3f3f3",  # Light gray (main background)
-    "surface": "#ffffff",  # White (cards, panels)
-    "foreground": "#1a1a1a",  # Near black (primary text)
-    "muted": "#6e6e6e",  # Gray (secondary text)
-    "border": "#e1e1e1",  # Light border color
-    "shadow": "#00000020",  # Shadow color with alpha
-    "accent": "#0078d4",  # Accent color for focus
-    "on_accent": "#ffffff",  # Text on accent color
-    "disabled": "#a0a0a0",  # Disabled state foreground
-    "disabled_bg": "#e8e8e8",  # Disabled state background
-}
+COLORS_LIGHT: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "primary": "#0078d4",  # Windows 11 accent blue
+        "secondary": "#6c757d",  # Gray (secondary actions)
+        "success": "#107c10",  # Green (success states)
+        "info": "#0078d4",  # Blue (informational)
+        "warning": "#8a6914",  # Dark gold (warnings) - WCAG AA compliant on white
+        "danger": "#d13438",  # Red (errors, recording indicator)
+        "background": "#f3f3f3",  # Light gray (main background)
+        "surface": "#ffffff",  # White (cards, panels)
+        "foreground": "#1a1a1a",  # Near black (primary text)
+        "muted": "#6e6e6e",  # Gray (secondary text)
+        "border": "#e1e1e1",  # Light border color
+        "shadow": "#00000020",  # Shadow color with alpha
+        "accent": "#0078d4",  # Accent color for focus
+        "on_accent": "#ffffff",  # Text on accent color
+        "disabled": "#a0a0a0",  # Disabled state foreground
+        "disabled_bg": "#e8e8e8",  # Disabled state background
+    }
+)
 
 # Dark theme color palette (Fluent Design)
 # WCAG AA Contrast Ratios (minimum 4.5:1 for normal text, 3:1 for large text):
@@ -110,59 +131,88 @@ COLORS_LIGHT: Final[dict[str, str]] = {
 #   - danger (#ff6b6b) on surface (#2d2d2d): 6.4:1 ✓
 #   - warning (#fce100) on surface (#2d2d2d): 12.1:1 ✓
 #   - on_accent (#000000) on primary (#60cdff): 9.2:1 ✓
-COLORS_DARK: Final[dict[str, str]] = {
-    "primary": "#60cdff",  # Light blue for dark mode
-    "secondary": "#9e9e9e",  # Gray (secondary actions)
-    "success": "#6ccb5f",  # Light green
-    "info": "#60cdff",  # Light blue
-    "warning": "#fce100",  # Bright yellow
-    "danger": "#ff6b6b",  # Light red
-    "background": "#202020",  # Dark background
-    "surface": "#2d2d2d",  # Elevated surface
-    "foreground": "#ffffff",  # White text
-    "muted": "#a0a0a0",  # Muted text
-    "border": "#404040",  # Dark border
-    "shadow": "#00000040",  # Darker shadow
-    "accent": "#60cdff",  # Accent color
-    "on_accent": "#000000",  # Text on accent
-    "disabled": "#6e6e6e",  # Disabled state foreground
-    "disabled_bg": "#3a3a3a",  # Disabled state background
-}
+COLORS_DARK: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "primary": "#60cdff",  # Light blue for dark mode
+        "secondary": "#9e9e9e",  # Gray (secondary actions)
+        "success": "#6ccb5f",  # Light green
+        "info": "#60cdff",  # Light blue
+        "warning": "#fce100",  # Bright yellow
+        "danger": "#ff6b6b",  # Light red
+        "background": "#202020",  # Dark background
+        "surface": "#2d2d2d",  # Elevated surface
+        "foreground": "#ffffff",  # White text
+        "muted": "#a0a0a0",  # Muted text
+        "border": "#404040",  # Dark border
+        "shadow": "#00000040",  # Darker shadow
+        "accent": "#60cdff",  # Accent color
+        "on_accent": "#000000",  # Text on accent
+        "disabled": "#6e6e6e",  # Disabled state foreground
+        "disabled_bg": "#3a3a3a",  # Disabled state background
+    }
+)
 
 # Legacy COLORS for backward compatibility (defaults to light)
-COLORS: Final[dict[str, str]] = COLORS_LIGHT
+COLORS: Final[Mapping[str, str]] = COLORS_LIGHT
 
 # Window dimensions
-WINDOW_SIZE: Final[dict[str, int]] = {
-    "width": 600,
-    "height": 500,
-    "min_width": 400,
-    "min_height": 350,
+WINDOW_SIZE: Final[Mapping[str, int]] = MappingProxyType(
+    {
+        "width": 600,
+        "height": 500,
+        "min_width": 400,
+        "min_height": 350,
+    }
+)
+
+# Theme name to palette lookup table
+_THEME_COLORS: Final[dict[str, Mapping[str, str]]] = {
+    "light": COLORS_LIGHT,
+    "dark": COLORS_DARK,
 }
 
-# Current theme state (mutable)
-_current_theme: str = "light"
 
-
-def get_colors(theme: str = "light") -> dict[str, str]:
+def get_colors(theme: str = "light") -> Mapping[str, str]:
     """Get color palette for specified theme.
 
     Args:
         theme: "light" or "dark"
 
     Returns:
-        Dictionary of color name to hex value
+        Read-only mapping of color name to hex value
     """
-    return COLORS_DARK if theme == "dark" else COLORS_LIGHT
+    return _THEME_COLORS.get(theme, COLORS_LIGHT)
+
 
+def get_colors_readonly(theme: str = "light") -> Mapping[str, str]:
+    """Get a read-only view of the color palette for specified theme.
 
-def get_current_theme() -> str:
-    """Get the current theme name.
+    The palettes are frozen at import, so this is equivalent to
+    ``get_colors`` and kept for callers that request immutability explicitly.
+
+    Args:
+        theme: "light" or "dark"
 
     Returns:
-        "light" or "dark"
+        Read-only mapping of color name to hex value
     """
-    return _current_theme
+    return get_colors(theme)
+
+
+def get_current_theme(root: ttk.Window | None = None) -> str:
+    """Get the current theme name of a window.
+
+    The theme is stored on the window by ``switch_theme`` and
+    ``create_themed_window`` rather than in module state, so each window
+    tracks its own theme.
+
+    Args:
+        root: Window to read the theme from
+
+    Returns:
+        "light" or "dark"; "light" if no window is given or no theme was applied
+    """
+    return getattr(root, "_vox_theme", "light")
 
 
 def switch_theme(root: ttk.Window, theme: str) -> None:
@@ -172,13 +222,11 @@ def switch_theme(root: ttk.Window, theme: str) -> None:
         root: Main window instance
         theme: "light" or "dark"
     """
-    global _current_theme
-
     if theme not in THEMES:
-        logger.warning(f"Invalid theme '{theme}', defaulting to 'light'")
+        logger.warning("Invalid theme '%s', defaulting to 'light'", theme)
         theme = "light"
 
-    _current_theme = theme
+    root._vox_theme = theme  # type: ignore[attr-defined]
     theme_name = THEMES[theme]
 
     # Switch ttkbootstrap theme
@@ -187,169 +235,217 @@ def switch_theme(root: ttk.Window, theme: str) -> None:
     # Apply Fluent style overrides for the new theme
     configure_fluent_overrides(root.style, theme)
 
-    logger.info(f"Switched to {theme} theme ({theme_name})")
+    logger.info("Switched to %s theme (%s)", theme, theme_name)
 
 
-def configure_fluent_overrides(style: ttk.Style, theme: str = "light") -> None:
-    """Configure Fluent Design style overrides.
+def _build_fluent_specs(theme: str) -> tuple[tuple[str, str, dict[str, Any]], ...]:
+    """Build the ordered Fluent Design style operations for a theme.
 
-    Sets up custom styles for:
-    - Tabs with rounded indicators and hover/focus states
-    - Buttons with rounded corners
-    - Cards with elevated appearance
-    - Focus indicators for accessibility
+    Each entry is ``(method, style_name, options)`` where ``method`` is
+    ``"configure"`` or ``"map"``. Order is significant: later ``map`` calls
+    for the same style replace earlier mappings of the same option.
 
     Args:
-        style: ttkbootstrap Style instance
         theme: "light" or "dark" theme name
+
+    Returns:
+        Tuple of style operations to apply to a ttk Style
     """
     colors = get_colors(theme)
-
-    # Tab styling - rounded pill selection indicator with hover/focus states
-    style.configure(
-        "TNotebook",
-        tabmargins=[SPACING["xs"], SPACING["xs"], SPACING["xs"], 0],
+    tab_padding = (SPACING["md"], SPACING["sm"])
+
+    return (
+        # Tab styling - rounded pill selection indicator with hover/focus states
+        (
+            "configure",
+            "TNotebook",
+            {"tabmargins": (SPACING["xs"], SPACING["xs"], SPACING["xs"], 0)},
+        ),
+        (
+            "configure",
+            "TNotebook.Tab",
+            {
+                "padding": tab_padding,
+                "font": (FONT_FAMILY, 11, "normal"),
+                "focuscolor": colors["accent"],
+            },
+        ),
+        (
+            "map",
+            "TNotebook.Tab",
+            {
+                "background": (
+                    ("selected", colors["surface"]),
+                    ("active", colors["border"]),  # Hover state
+                    ("!selected", colors["background"]),
+                ),
+                "foreground": (
+                    ("selected", colors["primary"]),
+                    ("active", colors["foreground"]),  # Hover state
+                    ("!selected", colors["muted"]),
+                ),
+                "padding": (
+                    ("selected", tab_padding),
+                    ("active", tab_padding),  # Pressed state
+                ),
+            },
+        ),
+        # Button styling - rounded corners, focus states
+        (
+            "configure",
+            "TButton",
+            {
+                "padding": tab_padding,
+                "font": (FONT_FAMILY, 11, "normal"),
+                "focuscolor": colors["accent"],
+            },
+        ),
+        (
+            "map",
+            "TButton",
+            {
+                "background": (
+                    ("active", colors["primary"]),
+                    ("pressed", colors["accent"]),
+                ),
+            },
+        ),
+        # Primary accent button style
+        (
+            "configure",
+            "Accent.TButton",
+            {
+                "background": colors["primary"],
+                "foreground": colors["on_accent"],
+                "padding": (SPACING["lg"], SPACING["md"]),
+                "font": (FONT_FAMILY, 12, "bold"),
+            },
+        ),
+        # Focus ring styling for accessibility
+        ("map", "TButton", {"focuscolor": (("focus", colors["accent"]),)}),
+        ("map", "TScale", {"focuscolor": (("focus", colors["accent"]),)}),
+        # Entry field focus styling
+        (
+            "map",
+            "TEntry",
+            {
+                "focuscolor": (("focus", colors["accent"]),),
+                "bordercolor": (("focus", colors["primary"]),),
+            },
+        ),
+        # Checkbutton focus styling
+        ("map", "TCheckbutton", {"focuscolor": (("focus", colors["accent"]),)}),
+        # Combobox focus styling
+        (
+            "map",
+            "TCombobox",
+            {
+                "focuscolor": (("focus", colors["accent"]),),
+                "bordercolor": (("focus", colors["primary"]),),
+            },
+        ),
+        # Spinbox focus styling
+        (
+            "map",
+            "TSpinbox",
+            {
+                "focuscolor": (("focus", colors["accent"]),),
+                "bordercolor": (("focus", colors["primary"]),),
+            },
+        ),
+        # Disabled state styling for buttons - visually distinguishable
+        (
+            "map",
+            "TButton",
+            {
+                "foreground": (
+                    ("disabled", colors["disabled"]),
+                    ("!disabled", colors["foreground"]),
+                ),
+                "background": (("disabled", colors["disabled_bg"]),),
+            },
+        ),
+        # Disabled state styling for entry fields
+        (
+            "map",
+            "TEntry",
+            {
+                "foreground": (("disabled", colors["disabled"]),),
+                "fieldbackground": (("disabled", colors["disabled_bg"]),),
+            },
+        ),
+        # Disabled state styling for checkbuttons
+        ("map", "TCheckbutton", {"foreground": (("disabled", colors["disabled"]),)}),
+        # Disabled state styling for scales/sliders
+        ("map", "TScale", {"troughcolor": (("disabled", colors["disabled_bg"]),)}),
+        # Disabled state styling for combobox
+        (
+            "map",
+            "TCombobox",
+            {
+                "foreground": (("disabled", colors["disabled"]),),
+                "fieldbackground": (("disabled", colors["disabled_bg"]),),
+            },
+        ),
     )
 
-    style.configure(
-        "TNotebook.Tab",
-        padding=[SPACING["md"], SPACING["sm"]],
-        font=(FONT_FAMILY, 11, "normal"),
-        focuscolor=colors["accent"],
-    )
 
-    style.map(
-        "TNotebook.Tab",
-        background=[
-            ("selected", colors["surface"]),
-            ("active", colors["border"]),  # Hover state
-            ("!selected", colors["background"]),
-        ],
-        foreground=[
-            ("selected", colors["primary"]),
-            ("active", colors["foreground"]),  # Hover state
-            ("!selected", colors["muted"]),
-        ],
-        padding=[
-            ("selected", [SPACING["md"], SPACING["sm"]]),
-            ("active", [SPACING["md"], SPACING["sm"]]),  # Pressed state
-        ],
-    )
+def _compile_fluent_specs(
+    specs: tuple[tuple[str, str, dict[str, Any]], ...],
+) -> tuple[tuple[tuple[str, dict[str, Any]], ...], dict[str, dict[str, dict[str, Any]]]]:
+    """Split style operations into configure calls and a batched map script.
 
-    # Button styling - rounded corners, focus states
-    style.configure(
-        "TButton",
-        padding=[SPACING["md"], SPACING["sm"]],
-        font=(FONT_FAMILY, 11, "normal"),
-        focuscolor=colors["accent"],
-    )
-
-    style.map(
-        "TButton",
-        background=[
-            ("active", colors["primary"]),
-            ("pressed", colors["accent"]),
-        ],
-    )
+    ``configure`` calls stay individual so ttkbootstrap can register custom
+    styles. ``map`` calls are merged per style, in order, into the settings
+    format accepted by ``Style.theme_settings`` so they reach Tcl in a
+    single evaluation.
 
-    # Primary accent button style
-    style.configure(
-        "Accent.TButton",
-        background=colors["primary"],
-        foreground=colors["on_accent"],
-        padding=[SPACING["lg"], SPACING["md"]],
-        font=(FONT_FAMILY, 12, "bold"),
-    )
+    Args:
+        specs: Ordered style operations from ``_build_fluent_specs``
 
-    # Focus ring styling for accessibility
-    style.map(
-        "TButton",
-        focuscolor=[("focus", colors["accent"])],
-    )
+    Returns:
+        Tuple of (configure operations, theme_settings map settings)
+    """
+    configures: list[tuple[str, dict[str, Any]]] = []
+    map_settings: dict[str, dict[str, dict[str, Any]]] = {}
 
-    style.map(
-        "TScale",
-        focuscolor=[("focus", colors["accent"])],
-    )
+    for method, style_name, options in specs:
+        if method == "configure":
+            configures.append((style_name, options))
+        else:
+            map_settings.setdefault(style_name, {"map": {}})["map"].update(options)
 
-    # Entry field focus styling
-    style.map(
-        "TEntry",
-        focuscolor=[("focus", colors["accent"])],
-        bordercolor=[("focus", colors["primary"])],
-    )
+    return tuple(configures), map_settings
 
-    # Checkbutton focus styling
-    style.map(
-        "TCheckbutton",
-        focuscolor=[("focus", colors["accent"])],
-    )
 
-    # Combobox focus styling
-    style.map(
-        "TCombobox",
-        focuscolor=[("focus", colors["accent"])],
-        bordercolor=[("focus", colors["primary"])],
-    )
+# Fluent style operations are pure functions of the theme, so build them once
+_FLUENT_SPECS: Final[dict[str, tuple[tuple[tuple[str, dict[str, Any]], ...], dict[str, dict[str, dict[str, Any]]]]]] = {
+    theme: _compile_fluent_specs(_build_fluent_specs(theme)) for theme in THEMES
+}
 
-    # Spinbox focus styling
-    style.map(
-        "TSpinbox",
-        focuscolor=[("focus", colors["accent"])],
-        bordercolor=[("focus", colors["primary"])],
-    )
 
-    # Disabled state styling for buttons - visually distinguishable
-    style.map(
-        "TButton",
-        foreground=[
-            ("disabled", colors["disabled"]),
-            ("!disabled", colors["foreground"]),
-        ],
-        background=[
-            ("disabled", colors["disabled_bg"]),
-        ],
-    )
+def configure_fluent_overrides(style: ttk.Style, theme: str = "light") -> None:
+    """Configure Fluent Design style overrides.
 
-    # Disabled state styling for entry fields
-    style.map(
-        "TEntry",
-        foreground=[
-            ("disabled", colors["disabled"]),
-        ],
-        fieldbackground=[
-            ("disabled", colors["disabled_bg"]),
-        ],
-    )
+    Sets up custom styles for:
+    - Tabs with rounded indicators and hover/focus states
+    - Buttons with rounded corners
+    - Cards with elevated appearance
+    - Focus indicators for accessibility
 
-    # Disabled state styling for checkbuttons
-    style.map(
-        "TCheckbutton",
-        foreground=[
-            ("disabled", colors["disabled"]),
-        ],
-    )
+    Args:
+        style: ttkbootstrap Style instance
+        theme: "light" or "dark" theme name
+    """
+    configures, map_settings = _FLUENT_SPECS.get(theme, _FLUENT_SPECS["light"])
 
-    # Disabled state styling for scales/sliders
-    style.map(
-        "TScale",
-        troughcolor=[
-            ("disabled", colors["disabled_bg"]),
-        ],
-    )
+    for style_name, options in configures:
+        style.configure(style_name, **options)
 
-    # Disabled state styling for combobox
-    style.map(
-        "TCombobox",
-        foreground=[
-            ("disabled", colors["disabled"]),
-        ],
-        fieldbackground=[
-            ("disabled", colors["disabled_bg"]),
-        ],
-    )
+    # All state maps are sent to Tcl as one script rather than one call each
+    style.theme_settings(style.theme_use(), map_settings)
 
-    logger.debug(f"Fluent style overrides configured for {theme} theme")
+    logger.debug("Fluent style overrides configured for %s theme", theme)
 
 
 def create_themed_window(title: str = "Vox", theme: str = "light") -> ttk.Window:
@@ -362,8 +458,10 @@ def create_themed_window(title: str = "Vox", theme: str = "light") -> ttk.Window
     Returns:
         Configured ttkbootstrap Window instance
     """
-    global _current_theme
-    _current_theme = theme
+    # Imported lazily so that consumers of the style constants alone do not
+    # pay for loading ttkbootstrap and the Tk style machinery.
+    import ttkbootstrap as ttk
+
     theme_name = THEMES.get(theme, THEMES["light"])
 
     window = ttk.Window(
@@ -372,6 +470,7 @@ def create_themed_window(title: str = "Vox", theme: str = "light") -> ttk.Window
         size=(WINDOW_SIZE["width"], WINDOW_SIZE["height"]),
         minsize=(WINDOW_SIZE["min_width"], WINDOW_SIZE["min_height"]),
     )
+    window._vox_theme = theme  # type: ignore[attr-defined]
 
     # Center window on screen
     window.place_window_center()
@@ -379,10 +478,33 @@ def create_themed_window(title: str = "Vox", theme: str = "light") -> ttk.Window
     # Apply Fluent style overrides
     configure_fluent_overrides(window.style, theme)
 
-    logger.debug(f"Created themed window: {title} with {theme} theme")
+    logger.debug("Created themed window: %s with %s theme", title, theme)
     return window
 
 
+# Label styles as (style name, FONTS key or None, colors key for foreground)
+_LABEL_STYLES: Final[tuple[tuple[str, str | None, str], ...]] = (
+    # Custom style for section headers
+    # Legacy - use FONTS["title"] for new code
+    ("Header.TLabel", "subtitle", "foreground"),
+    # Fluent Design type scale styles
+    ("Display.TLabel", "display", "foreground"),
+    ("Title.TLabel", "title", "foreground"),
+    ("Subtitle.TLabel", "subtitle", "foreground"),
+    ("Body.TLabel", "body", "foreground"),
+    ("Caption.TLabel", "caption", "muted"),
+    # Custom style for muted/secondary text
+    # Legacy - use Caption.TLabel for new code
+    ("Muted.TLabel", "caption", "muted"),
+    # Custom style for monospace text (hotkey display)
+    ("Mono.TLabel", "mono", "primary"),
+    # Status indicator styles
+    ("Success.TLabel", None, "success"),
+    ("Danger.TLabel", None, "danger"),
+    ("Primary.TLabel", None, "primary"),
+)
+
+
 def configure_styles(style: ttk.Style, theme: str = "light") -> None:
     """Configure custom styles for the application.
 
@@ -398,75 +520,11 @@ def configure_styles(style: ttk.Style, theme: str = "light") -> None:
         background=colors["surface"],
     )
 
-    # Custom style for section headers
-    # Legacy - use FONTS["title"] for new code
-    style.configure(
-        "Header.TLabel",
-        font=FONTS["subtitle"],
-        foreground=colors["foreground"],
-    )
-
-    # Fluent Design type scale styles
-    style.configure(
-        "Display.TLabel",
-        font=FONTS["display"],
-        foreground=colors["foreground"],
-    )
-
-    style.configure(
-        "Title.TLabel",
-        font=FONTS["title"],
-        foreground=colors["foreground"],
-    )
-
-    style.configure(
-        "Subtitle.TLabel",
-        font=FONTS["subtitle"],
-        foreground=colors["foreground"],
-    )
-
-    style.configure(
-        "Body.TLabel",
-        font=FONTS["body"],
-        foreground=colors["foreground"],
-    )
-
-    style.configure(
-        "Caption.TLabel",
-        font=FONTS["caption"],
-        foreground=colors["muted"],
-    )
-
-    # Custom style for muted/secondary text
-    # Legacy - use Caption.TLabel for new code
-    style.configure(
-        "Muted.TLabel",
-        font=FONTS["caption"],
-        foreground=colors["muted"],
-    )
-
-    # Custom style for monospace text (hotkey display)
-    style.configure(
-        "Mono.TLabel",
-        font=FONTS["mono"],
-        foreground=colors["primary"],
-    )
-
-    # Status indicator styles
-    style.configure(
-        "Success.TLabel",
-        foreground=colors["success"],
-    )
-
-    style.configure(
-        "Danger.TLabel",
-        foreground=colors["danger"],
-    )
-
-    style.configure(
-        "Primary.TLabel",
-        foreground=colors["primary"],
-    )
+    for style_name, font_key, color_key in _LABEL_STYLES:
+        if font_key is None:
+            style.configure(style_name, foreground=colors[color_key])
+        else:
+            style.configure(style_name, font=FONTS[font_key], foreground=colors[color_key])
 
     # Pill-style status indicator
     style.configure(
@@ -475,4 +533,4 @@ def configure_styles(style: ttk.Style, theme: str = "light") -> None:
         padding=[SPACING["md"], SPACING["sm"]],
     )
 
-    logger.debug(f"Custom styles configured for {theme} theme")
+    logger.debug("Custom styles configured for %s theme", theme)
@@ -4,14 +4,79 @@ Provides system tray icon functionality using pystray, allowing the app
 to minimize to tray and provide quick access via tray menu.
 """
 
+import os
 import threading
-from pathlib import Path
-from typing import Callable, Optional
+from functools import lru_cache
+from typing import Callable, ClassVar, Optional
 
 # pystray must be imported after PIL
 import pystray
 from PIL import Image
 
+# Candidate tray icon files, in order of preference
+_ICON_PATHS: tuple[str, ...] = (
+    "build/resources/vox.ico",
+    "imgs/vox.ico",
+    "imgs/icon.ico",
+)
+
+
+def _noop() -> None:
+    """Default tray menu callback that does nothing."""
+
+
+def _line_pixels(start: tuple[int, int], end: tuple[int, int]) -> list[tuple[int, int]]:
+    """Rasterize a one-pixel line between two points (Bresenham).
+
+    Args:
+        start: (x, y) start point.
+        end: (x, y) end point.
+
+    Returns:
+        List of (x, y) pixel coordinates along the line.
+    """
+    x, y = start
+    end_x, end_y = end
+    dx = abs(end_x - x)
+    dy = -abs(end_y - y)
+    step_x = 1 if x < end_x else -1
+    step_y = 1 if y < end_y else -1
+    error = dx + dy
+
+    pixels = [(x, y)]
+    while (x, y) != (end_x, end_y):
+        doubled = 2 * error
+        if doubled >= dy:
+            error += dy
+            x += step_x
+        if doubled <= dx:
+            error += dx
+            y += step_y
+        pixels.append((x, y))
+    return pixels
+
+
+def _stroke_pixels(points: tuple[tuple[int, int], ...], width: int, size: int) -> set[tuple[int, int]]:
+    """Compute the pixels covered by a polyline drawn with a square pen.
+
+    Args:
+        points: Polyline vertices as (x, y) tuples.
+        width: Pen width in pixels.
+        size: Image side length; pixels outside the image are dropped.
+
+    Returns:
+        Set of (x, y) pixel coordinates covered by the stroke.
+    """
+    low = -(width // 2)
+    high = low + width
+    covered: set[tuple[int, int]] = set()
+    for start, end in zip(points, points[1:]):
+        for x, y in _line_pixels(start, end):
+            for px in range(max(x + low, 0), min(x + high, size)):
+                for py in range(max(y + low, 0), min(y + high, size)):
+                    covered.add((px, py))
+    return covered
+
 
 class SystemTrayManager:
     """Manages the system tray icon for Vox application.
@@ -30,6 +95,9 @@ class SystemTrayManager:
         _is_visible: Whether the main window is visible.
     """
 
+    # Generated fallback icon, shared by all instances once built
+    _FALLBACK_ICON: ClassVar[Optional[Image.Image]] = None
+
     def __init__(
         self,
         on_show: Optional[Callable[[], None]] = None,
@@ -43,9 +111,9 @@ class SystemTrayManager:
             on_hide: Callback when Hide is selected from tray menu.
             on_exit: Callback when Exit is selected from tray menu.
         """
-        self._on_show = on_show
-        self._on_hide = on_hide
-        self._on_exit = on_exit
+        self._on_show = on_show or _noop
+        self._on_hide = on_hide or _noop
+        self._on_exit = on_exit or _noop
         self._is_visible = True
         self._icon: Optional[pystray.Icon] = None
         self._thread: Optional[threading.Thread] = None
@@ -128,54 +196,68 @@ class SystemTrayManager:
         if self._icon:
             self._icon.run()
 
+    @classmethod
+    @lru_cache(maxsize=1)
+    def _cached_icon(cls) -> Optional[Image.Image]:
+        """Load and decode the tray icon file once per process.
+
+        Returns:
+            Decoded PIL Image, or None if no icon file exists.
+        """
+        icon_path = next((path for path in _ICON_PATHS if os.path.isfile(path)), None)
+        if icon_path is None:
+            return None
+
+        image = Image.open(icon_path)
+        image.load()
+        return image
+
     def _load_icon_image(self) -> Image.Image:
         """Load the tray icon image.
 
         Returns:
             PIL Image for the tray icon.
         """
-        # Try to load custom icon first
-        icon_paths = [
-            Path("build/resources/vox.ico"),
-            Path("imgs/vox.ico"),
-            Path("imgs/icon.ico"),
-        ]
-
-        for path in icon_paths:
-            if path.exists():
-                return Image.open(path)
+        icon = type(self)._cached_icon()
+        if icon is not None:
+            return icon.copy()
 
         # Fallback: Create a simple colored square icon
         return self._create_fallback_icon()
 
-    def _create_fallback_icon(self) -> Image.Image:
+    @classmethod
+    def _create_fallback_icon(cls) -> Image.Image:
         """Create a simple fallback icon if no icon file exists.
 
+        The icon is drawn once and the same instance is returned on later
+        calls; pystray only reads the image, so it is not copied.
+
         Returns:
             PIL Image with a simple Vox icon.
         """
-        # Create a 64x64 image with Vox primary color
-        size = 64
-        color = (69, 130, 236)  # #4582ec - primary blue
-
-        image = Image.new("RGB", (size, size), color)
-
-        # Draw a simple "V" shape in white
-        from PIL import ImageDraw
+        if cls._FALLBACK_ICON is not None:
+            return cls._FALLBACK_ICON
 
-        draw = ImageDraw.Draw(image)
+        # Fill a 64x64 RGB buffer with Vox primary color
+        size = 64
+        color = bytes((69, 130, 236))  # #4582ec - primary blue
+        buffer = bytearray(color * (size * size))
 
         # V shape points
         margin = 12
-        points = [
-            (margin, margin),  # Top-left
-            (size // 2, size - margin),  # Bottom-center
-            (size - margin, margin),  # Top-right
-        ]
+        top_left = (margin, margin)
+        bottom_center = (size // 2, size - margin)
+        top_right = (size - margin, margin)
+
+        # Stamp a simple "V" shape in white directly into the buffer
+        white = b"\xff\xff\xff"
+        for x, y in _stroke_pixels((top_left, bottom_center, top_right), width=6, size=size):
+            offset = (y * size + x) * 3
+            buffer[offset : offset + 3] = white
 
-        draw.line(points[:2], fill="white", width=6)
-        draw.line(points[1:], fill="white", width=6)
+        image = Image.frombytes("RGB", (size, size), bytes(buffer))
 
+        cls._FALLBACK_ICON = image
         return image
 
     def _handle_show(self, icon: pystray.Icon, item: pystray.MenuItem) -> None:
@@ -186,8 +268,7 @@ class SystemTrayManager:
             item: The clicked menu item.
         """
         self._is_visible = True
-        if self._on_show:
-            self._on_show()
+        self._on_show()
 
     def _handle_hide(self, icon: pystray.Icon, item: pystray.MenuItem) -> None:
         """Handle Hide menu item click.
@@ -197,8 +278,7 @@ class SystemTrayManager:
             item: The clicked menu item.
         """
         self._is_visible = False
-        if self._on_hide:
-            self._on_hide()
+        self._on_hide()
 
     def _handle_exit(self, icon: pystray.Icon, item: pystray.MenuItem) -> None:
         """Handle Exit menu item click.
@@ -208,5 +288,4 @@ class SystemTrayManager:
             item: The clicked menu item.
         """
         self.stop()
-        if self._on_exit:
-            self._on_exit()
+        self._on_exit()
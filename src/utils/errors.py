@@ -31,6 +31,13 @@ Exception Hierarchy:
         └── DatabaseError
 """
 
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
+
+# Shared read-only context for exceptions raised without context
+_EMPTY_CTX: Mapping = MappingProxyType({})
+
 
 class voxException(Exception):
     """Base exception for all vox errors.
@@ -41,9 +48,20 @@ class voxException(Exception):
     Attributes:
         message: Human-readable error description.
         error_code: Machine-readable error code for programmatic handling.
-        context: Dictionary of additional contextual information.
+        context: Mapping of additional contextual information (a shared
+            read-only empty mapping when none was given).
     """
 
+    __slots__ = ("message", "error_code", "context", "_formatted")
+
+    # Error code used when none is given; set per subclass by __init_subclass__
+    _default_error_code: str = "voxException"
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Record the subclass name as its default error code."""
+        super().__init_subclass__(**kwargs)
+        cls._default_error_code = cls.__name__
+
     def __init__(
         self,
         message: str,
@@ -60,9 +78,42 @@ class voxException(Exception):
                 (e.g., {"tab_id": 123, "url": "https://example.com"}).
         """
         self.message = message
-        self.error_code = error_code or self.__class__.__name__
-        self.context = context or {}
-        super().__init__(self.format_message())
+        # Codes are compared in dispatch handlers; interning makes equal codes share one object
+        self.error_code = sys.intern(error_code) if error_code else self._default_error_code
+        self.context = context if context else _EMPTY_CTX
+        self._formatted: str | None = None
+        # The formatted message is built on first str() so exceptions that are
+        # caught and discarded never pay for joining the context
+        super().__init__(message)
+
+    def __reduce__(self):
+        """Rebuild from the constructor arguments when pickled or copied.
+
+        Slotted attributes are not part of BaseException's pickle state, so
+        without this the error code and context would be lost.
+        """
+        return (type(self), (self.message, self.error_code, dict(self.context)))
+
+    def __str__(self) -> str:
+        """Return the formatted message, building it on first access."""
+        if self._formatted is None:
+            self._formatted = self.format_message()
+        return self._formatted
+
+    def __format__(self, format_spec: str) -> str:
+        """Format the cached message, so f-strings reuse ``__str__``'s result."""
+        return format(str(self), format_spec)
+
+    def short(self) -> str:
+        """Return the code and message without the context.
+
+        Cheaper than ``str()`` when the context is large; prefer it in
+        ``log.debug("failure: %s", exc.short())`` calls on hot paths.
+
+        Returns:
+            String in the format [ERROR_CODE] Message.
+        """
+        return f"[{self.error_code}] {self.message}"
 
     def format_message(self) -> str:
         """Format error message with code and context.
@@ -73,7 +124,7 @@ class voxException(Exception):
             [ERROR_CODE] Message (key=value; ...).
         """
         msg = f"[{self.error_code}] {self.message}"
-        if self.context:
+        if self.context is not _EMPTY_CTX:
             context_str = "; ".join(f"{k}={v}" for k, v in self.context.items())
             msg += f" ({context_str})"
         return msg
@@ -86,7 +137,7 @@ class BrowserDetectionError(voxException):
     a supported browser to retrieve the active tab information.
     """
 
-    pass
+    __slots__ = ()
 
 
 class TabNotFoundError(voxException):
@@ -95,7 +146,7 @@ class TabNotFoundError(voxException):
     The requested tab ID does not exist or is no longer available.
     """
 
-    pass
+    __slots__ = ()
 
 
 class ExtractionError(voxException):
@@ -105,7 +156,7 @@ class ExtractionError(voxException):
     more specific error types for URL fetching and file loading.
     """
 
-    pass
+    __slots__ = ()
 
 
 class TTSError(voxException):
@@ -114,7 +165,7 @@ class TTSError(voxException):
     Indicates a failure during speech synthesis operations.
     """
 
-    pass
+    __slots__ = ()
 
 
 class TTSInitializationError(TTSError):
@@ -124,7 +175,7 @@ class TTSInitializationError(TTSError):
     dependencies or system configuration issues.
     """
 
-    pass
+    __slots__ = ()
 
 
 class AudioPlaybackError(voxException):
@@ -134,7 +185,7 @@ class AudioPlaybackError(voxException):
     audio device issues or format incompatibility.
     """
 
-    pass
+    __slots__ = ()
 
 
 class URLFetchError(ExtractionError):
@@ -143,7 +194,7 @@ class URLFetchError(ExtractionError):
     Network errors, invalid URLs, or HTTP errors prevent content retrieval.
     """
 
-    pass
+    __slots__ = ()
 
 
 class FileLoadError(ExtractionError):
@@ -153,7 +204,7 @@ class FileLoadError(ExtractionError):
     encoding issues.
     """
 
-    pass
+    __slots__ = ()
 
 
 class SessionError(voxException):
@@ -162,7 +213,7 @@ class SessionError(voxException):
     Base exception for session-related errors during save/load operations.
     """
 
-    pass
+    __slots__ = ()
 
 
 class SessionNotFoundError(SessionError):
@@ -171,7 +222,7 @@ class SessionNotFoundError(SessionError):
     The requested session ID does not exist in storage.
     """
 
-    pass
+    __slots__ = ()
 
 
 class ConfigurationError(voxException):
@@ -180,7 +231,7 @@ class ConfigurationError(voxException):
     Configuration files are missing, malformed, or contain invalid values.
     """
 
-    pass
+    __slots__ = ()
 
 
 class ValidationError(voxException):
@@ -189,7 +240,7 @@ class ValidationError(voxException):
     User input or data does not meet the required format or constraints.
     """
 
-    pass
+    __slots__ = ()
 
 
 class MicrophoneError(voxException):
@@ -199,7 +250,7 @@ class MicrophoneError(voxException):
     or recording operations failed.
     """
 
-    pass
+    __slots__ = ()
 
 
 class TranscriptionError(voxException):
@@ -208,7 +259,7 @@ class TranscriptionError(voxException):
     The STT engine could not process the audio or returned an error.
     """
 
-    pass
+    __slots__ = ()
 
 
 class ModelLoadError(voxException):
@@ -218,7 +269,7 @@ class ModelLoadError(voxException):
     missing model files or insufficient memory.
     """
 
-    pass
+    __slots__ = ()
 
 
 class TimeoutError(voxException):
@@ -227,7 +278,7 @@ class TimeoutError(voxException):
     The operation took longer than the allowed time limit.
     """
 
-    pass
+    __slots__ = ()
 
 
 # ============================================================================
@@ -242,7 +293,7 @@ class VoxError(voxException):
     from this class for easy catching of feature-specific errors.
     """
 
-    pass
+    __slots__ = ()
 
 
 class HotkeyError(VoxError):
@@ -252,7 +303,7 @@ class HotkeyError(VoxError):
     error types for registration conflicts and format issues.
     """
 
-    pass
+    __slots__ = ()
 
 
 class HotkeyAlreadyRegisteredError(HotkeyError):
@@ -262,7 +313,7 @@ class HotkeyAlreadyRegisteredError(HotkeyError):
     Unregister the existing hotkey before registering a new callback.
     """
 
-    pass
+    __slots__ = ()
 
 
 class HotkeyInvalidFormatError(HotkeyError):
@@ -274,7 +325,7 @@ class HotkeyInvalidFormatError(HotkeyError):
     - '<shift>+f1'
     """
 
-    pass
+    __slots__ = ()
 
 
 class RecordingError(VoxError):
@@ -283,7 +334,7 @@ class RecordingError(VoxError):
     Recording could not start, was interrupted, or failed to capture audio.
     """
 
-    pass
+    __slots__ = ()
 
 
 class PasteError(VoxError):
@@ -293,7 +344,7 @@ class PasteError(VoxError):
     failed. May occur if clipboard is locked by another application.
     """
 
-    pass
+    __slots__ = ()
 
 
 class DatabaseError(VoxError):
@@ -303,4 +354,4 @@ class DatabaseError(VoxError):
     problems, or constraint violations.
     """
 
-    pass
+    __slots__ = ()
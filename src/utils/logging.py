@@ -2,11 +2,21 @@
 
 import logging
 import logging.handlers
+import sys
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TextIO
 
 from src import config
 
+# Log level names accepted by setup_logging, including aliases like WARN and FATAL
+_LEVELS: dict[str, int] = logging.getLevelNamesMapping()
+
+# Handlers shared across setup_logging calls, so reconfiguring a logger does
+# not open another file descriptor for the same log file or stream. They stay
+# at NOTSET; each logger filters by its own level
+_FILE_HANDLERS: dict[Path, logging.handlers.RotatingFileHandler] = {}
+_CONSOLE_HANDLERS: dict[TextIO, logging.StreamHandler] = {}
+
 
 class ColoredFormatter(logging.Formatter):
     """Logging formatter with color support for console output."""
@@ -20,11 +30,31 @@ class ColoredFormatter(logging.Formatter):
     }
     RESET = "\033[0m"
 
+    # Level names wrapped in their color codes, built once below the class
+    # (a class-body comprehension cannot see RESET)
+    COLORED_LEVELS: dict[str, str]
+
     def format(self, record: logging.LogRecord) -> str:
-        """Format log record with color codes."""
-        if record.levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[record.levelname]}{record.levelname}{self.RESET}"
-        return super().format(record)
+        """Format log record with color codes.
+
+        The record's level name is only swapped for the duration of the call,
+        so other handlers formatting the same record see it unchanged.
+        """
+        levelname = record.levelname
+        record.levelname = self.COLORED_LEVELS.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
+
+
+ColoredFormatter.COLORED_LEVELS = {
+    name: f"{color}{name}{ColoredFormatter.RESET}" for name, color in ColoredFormatter.COLORS.items()
+}
+
+# Formatters hold no per-record state, so every handler shares one instance
+_CONSOLE_FMT = ColoredFormatter(config.LOG_FORMAT)
+_FILE_FMT = logging.Formatter(config.LOG_FORMAT)
 
 
 def setup_logging(
@@ -52,19 +82,21 @@ def setup_logging(
     # Set log level
     if level is None:
         level = config.LOG_LEVEL
-    logger.setLevel(getattr(logging, level.upper(), logging.INFO))
+    level_int = _LEVELS.get(level.upper(), logging.INFO)
+    logger.setLevel(level_int)
 
     # Remove existing handlers to avoid duplicates
     logger.handlers.clear()
 
     # Console handler
     if enable_console:
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(getattr(logging, level.upper(), logging.INFO))
+        stream = sys.stderr
+        console_handler = _CONSOLE_HANDLERS.get(stream)
+        if console_handler is None:
+            console_handler = _CONSOLE_HANDLERS[stream] = logging.StreamHandler(stream)
 
         # Use colored formatter for console
-        formatter = ColoredFormatter(config.LOG_FORMAT)
-        console_handler.setFormatter(formatter)
+        console_handler.setFormatter(_CONSOLE_FMT)
         logger.addHandler(console_handler)
 
     # File handler
@@ -72,18 +104,19 @@ def setup_logging(
         if log_file is None:
             log_file = config.LOGS_DIR / f"{name}.log"
 
-        log_file.parent.mkdir(parents=True, exist_ok=True)
+        log_file = log_file.resolve()
+        file_handler = _FILE_HANDLERS.get(log_file)
+        if file_handler is None:
+            log_file.parent.mkdir(parents=True, exist_ok=True)
 
-        file_handler = logging.handlers.RotatingFileHandler(
-            log_file,
-            maxBytes=config.LOG_FILE_SIZE_MB * 1024 * 1024,
-            backupCount=config.LOG_BACKUP_COUNT,
-        )
-        file_handler.setLevel(getattr(logging, level.upper(), logging.INFO))
+            file_handler = _FILE_HANDLERS[log_file] = logging.handlers.RotatingFileHandler(
+                log_file,
+                maxBytes=config.LOG_FILE_SIZE_MB * 1024 * 1024,
+                backupCount=config.LOG_BACKUP_COUNT,
+            )
 
         # Use standard formatter for file (no colors)
-        formatter = logging.Formatter(config.LOG_FORMAT)
-        file_handler.setFormatter(formatter)
+        file_handler.setFormatter(_FILE_FMT)
         logger.addHandler(file_handler)
 
     # Prevent propagation to avoid duplicate logs
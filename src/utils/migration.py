@@ -1,13 +1,75 @@
 """Configuration migration utilities for transitioning from vox to vox."""
 
-import json
-import shutil
-from datetime import datetime
+import os
+import time
 from pathlib import Path
 from typing import Optional
 
 from src.utils.errors import ConfigurationError
 
+# Marker written to the config directory once migration has been handled
+MIGRATION_MARKER: str = ".migrated"
+
+# Resolved once at import; APPDATA does not change while the app runs
+_APPDATA: Optional[str] = os.getenv("APPDATA")
+_VOX_CONFIG_DIR: Optional[Path] = Path(_APPDATA) / "vox" if _APPDATA else None
+
+
+def _fast_copytree(src: Path, dst: Path, copy_metadata: bool = True) -> None:
+    """Recursively copy a directory tree, merging into an existing destination.
+
+    Uses ``os.scandir`` so directory entries need no extra ``stat`` calls and
+    ``shutil.copyfile``, which delegates to the platform's kernel-level copy
+    (e.g. ``sendfile`` on Linux). Metadata copying can be skipped for large
+    trees such as models where timestamps do not matter.
+
+    Args:
+        src: Source directory
+        dst: Destination directory (created if missing)
+        copy_metadata: Whether to copy permissions and timestamps as well
+
+    Raises:
+        OSError: If a directory or file cannot be copied
+    """
+    import shutil
+
+    copy_file = shutil.copy2 if copy_metadata else shutil.copyfile
+    os.makedirs(dst, exist_ok=True)
+
+    with os.scandir(src) as entries:
+        for entry in entries:
+            target = dst / entry.name
+            if entry.is_dir():
+                _fast_copytree(Path(entry.path), target, copy_metadata)
+            else:
+                copy_file(entry.path, target)
+
+
+def _link_or_copy(src: str, dst: str, linkable_dir: str) -> None:
+    """Copy a file into the backup, hard-linking it if it lies under ``linkable_dir``.
+
+    A hard link shares the original's inode, so it is only safe for files that
+    are never rewritten in place, such as downloaded models. Everything else
+    (config.json is rewritten in place by save_user_config) gets a real copy so
+    the backup keeps the old contents.
+
+    Args:
+        src: Source file path
+        dst: Destination file path
+        linkable_dir: Directory prefix (with trailing separator) of files that may be linked
+    """
+    import shutil
+
+    if src.startswith(linkable_dir):
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            # Cross-device backups or filesystems without hard links (e.g. FAT)
+            pass
+
+    shutil.copy2(src, dst)
+
 
 def detect_old_config() -> Optional[Path]:
     """Check if old vox configuration exists.
@@ -18,15 +80,12 @@ def detect_old_config() -> Optional[Path]:
     Raises:
         ConfigurationError: If APPDATA environment variable is not set
     """
-    import os
-
-    appdata = os.getenv("APPDATA")
-    if not appdata:
+    if _VOX_CONFIG_DIR is None:
         raise ConfigurationError(
             "APPDATA environment variable not set", error_code="APPDATA_NOT_FOUND", context={"platform": "Windows"}
         )
 
-    old_config_dir = Path(appdata) / "vox"
+    old_config_dir = _VOX_CONFIG_DIR
 
     if old_config_dir.exists() and old_config_dir.is_dir():
         return old_config_dir
@@ -46,11 +105,17 @@ def backup_old_config(old_config_dir: Path) -> Path:
     Raises:
         ConfigurationError: If backup creation fails
     """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    import shutil
+    from functools import partial
+
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     backup_dir = old_config_dir.parent / f"vox_backup_{timestamp}"
 
+    # Only model files are written once and never modified, so only they may share storage
+    copy_file = partial(_link_or_copy, linkable_dir=os.path.join(old_config_dir, "models", ""))
+
     try:
-        shutil.copytree(old_config_dir, backup_dir)
+        shutil.copytree(old_config_dir, backup_dir, copy_function=copy_file)
         return backup_dir
     except (OSError, shutil.Error) as e:
         raise ConfigurationError(
@@ -78,6 +143,10 @@ def copy_config_files(old_config_dir: Path, new_config_dir: Path) -> dict[str, b
     Raises:
         ConfigurationError: If critical configuration copy fails
     """
+    # Only needed when migrating, which most launches skip
+    import json
+    import shutil
+
     results = {}
 
     # Ensure new config directory exists
@@ -89,16 +158,26 @@ def copy_config_files(old_config_dir: Path, new_config_dir: Path) -> dict[str, b
 
     if old_config_file.exists():
         try:
-            # Read old config and update app name if present
-            with open(old_config_file, "r") as f:
-                config_data = json.load(f)
-
-            # Update any vox references to vox
-            if isinstance(config_data, dict) and "app_name" in config_data:
-                config_data["app_name"] = "vox"
-
-            with open(new_config_file, "w") as f:
-                json.dump(config_data, f, indent=2)
+            raw_config = old_config_file.read_bytes()
+
+            if b'"app_name"' not in raw_config:
+                # Nothing to rewrite, so copy the bytes without a parse/dump round trip
+                new_config_file.write_bytes(raw_config)
+            else:
+                # Read old config and update app name if present
+                config_data = json.loads(raw_config)
+
+                # Update any vox references to vox; the raw bytes mention app_name,
+                # so the top-level object almost always has it
+                try:
+                    if "app_name" in config_data:
+                        config_data["app_name"] = "vox"
+                except TypeError:
+                    # Top-level JSON value is not an object, leave it unchanged
+                    pass
+
+                with open(new_config_file, "w") as f:
+                    json.dump(config_data, f, indent=2)
 
             results["config.json"] = True
         except (OSError, json.JSONDecodeError) as e:
@@ -114,7 +193,7 @@ def copy_config_files(old_config_dir: Path, new_config_dir: Path) -> dict[str, b
 
     if old_sessions.exists() and old_sessions.is_dir():
         try:
-            shutil.copytree(old_sessions, new_sessions, dirs_exist_ok=True)
+            _fast_copytree(old_sessions, new_sessions)
             results["sessions/"] = True
         except (OSError, shutil.Error) as e:
             raise ConfigurationError(
@@ -131,7 +210,7 @@ def copy_config_files(old_config_dir: Path, new_config_dir: Path) -> dict[str, b
 
     if old_models.exists() and old_models.is_dir():
         try:
-            shutil.copytree(old_models, new_models, dirs_exist_ok=True)
+            _fast_copytree(old_models, new_models, copy_metadata=False)
             results["models/"] = True
         except (OSError, shutil.Error) as e:
             # Models directory is not critical - log but don't fail
@@ -142,6 +221,20 @@ def copy_config_files(old_config_dir: Path, new_config_dir: Path) -> dict[str, b
     return results
 
 
+def _write_migration_marker(config_dir: Path) -> None:
+    """Record that migration has been handled for a config directory.
+
+    Args:
+        config_dir: Path to the vox configuration directory
+    """
+    try:
+        config_dir.mkdir(parents=True, exist_ok=True)
+        (config_dir / MIGRATION_MARKER).touch()
+    except OSError:
+        # The marker only skips future checks; failing to write it is harmless
+        pass
+
+
 def migrate_config() -> dict[str, any]:
     """Migrate configuration from vox to vox.
 
@@ -161,20 +254,28 @@ def migrate_config() -> dict[str, any]:
     Raises:
         ConfigurationError: If migration fails at any critical step
     """
-    import os
+    # Migration only ever needs to happen once; after that a single stat suffices
+    if _VOX_CONFIG_DIR is not None and (_VOX_CONFIG_DIR / MIGRATION_MARKER).exists():
+        return {
+            "migrated": False,
+            "backup_path": None,
+            "copied_files": {},
+            "message": "Configuration migration already completed",
+        }
 
     # Check for old configuration
     old_config_dir = detect_old_config()
 
+    # Get new config directory path
+    new_config_dir = _VOX_CONFIG_DIR
+
     if not old_config_dir:
+        _write_migration_marker(new_config_dir)
         return {"migrated": False, "backup_path": None, "copied_files": {}, "message": "No old vox configuration found"}
 
-    # Get new config directory path
-    appdata = os.getenv("APPDATA")
-    new_config_dir = Path(appdata) / "vox"
-
     # If new config already exists, skip migration
     if new_config_dir.exists() and (new_config_dir / "config.json").exists():
+        _write_migration_marker(new_config_dir)
         return {
             "migrated": False,
             "backup_path": None,
@@ -187,6 +288,7 @@ def migrate_config() -> dict[str, any]:
 
     # Copy configuration files
     copied_files = copy_config_files(old_config_dir, new_config_dir)
+    _write_migration_marker(new_config_dir)
 
     return {
         "migrated": True,
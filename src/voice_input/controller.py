@@ -6,17 +6,18 @@ transcription, and clipboard paste operations.
 """
 
 import logging
-import tempfile
+import queue
 import threading
-from pathlib import Path
-from typing import Callable, Literal, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Final, Literal, Optional
 
 from src.clipboard.paster import ClipboardPaster
-from src.hotkey.manager import HotkeyManager
+from src.hotkey.manager import HotkeyManager, parse_hotkey
 from src.persistence.database import VoxDatabase
 from src.persistence.models import AppState
 from src.stt.engine import STTEngine
 from src.stt.recorder import MicrophoneRecorder, check_microphone_available
+from src.stt.streaming import StreamingDecoder
 from src.ui.indicator import RecordingIndicator
 from src.utils.errors import (
     MicrophoneError,
@@ -29,6 +30,41 @@ logger = logging.getLogger(__name__)
 # Default hotkey for voice input
 DEFAULT_HOTKEY = "<ctrl>+<alt>+space"
 
+# Indicator display state for each application state (IDLE hides it)
+_INDICATOR_STATE_MAP: Final[dict[AppState, Literal["recording", "processing", "success", "error"]]] = {
+    AppState.RECORDING: "recording",
+    AppState.TRANSCRIBING: "processing",
+    AppState.PASTING: "success",
+    AppState.ERROR: "error",
+}
+
+
+class _NoRecorder:
+    """Stand-in for MicrophoneRecorder while no recorder is open.
+
+    Lets the controller call recorder methods without checking for None;
+    it never records and has no stream to close.
+    """
+
+    __slots__ = ()
+
+    is_recording = False
+    is_stream_open = False
+
+    def stop_recording(self) -> None:
+        """Report that nothing was recorded.
+
+        Raises:
+            MicrophoneError: Always, as there is no recording
+        """
+        raise MicrophoneError("No recording in progress", error_code="NO_AUDIO_RECORDED")
+
+    def close_stream(self) -> None:
+        """Do nothing; there is no stream."""
+
+
+_NO_RECORDER: Final = _NoRecorder()
+
 
 class VoiceInputController:
     """Central coordinator for hotkey-triggered voice input operations.
@@ -70,12 +106,44 @@ class VoiceInputController:
         >>> controller.stop()
     """
 
+    # Every instance attribute is listed here; callers such as MainWindow
+    # rebind the callback and indicator slots after construction
+    __slots__ = (
+        "_database",
+        "_on_state_change",
+        "_on_error",
+        "_indicator",
+        "_on_history_saved",
+        "_state",
+        "_state_lock",
+        "_callback_q",
+        "_callback_runner",
+        "_hotkey_manager",
+        "_recorder",
+        "_stt_engine",
+        "_paster",
+        "_paste_pool",
+        "_current_hotkey",
+        "_settings_cache",
+        "_is_started",
+        "_decoder",
+        "_mic_ok",
+        "_mic_error",
+        "_work_q",
+        "_worker",
+        "_history_q",
+        "_history_writer",
+        "_stt_ready",
+        "_stt_warmup",
+    )
+
     def __init__(
         self,
         database: VoxDatabase,
         on_state_change: Optional[Callable[[AppState], None]] = None,
         on_error: Optional[Callable[[str], None]] = None,
         indicator: Optional[RecordingIndicator] = None,
+        on_history_saved: Optional[Callable[[], None]] = None,
     ) -> None:
         """Initialize the voice input controller.
 
@@ -92,28 +160,71 @@ class VoiceInputController:
                 Receives the error message as argument.
             indicator: Optional RecordingIndicator instance for visual
                 feedback during recording and processing.
+            on_history_saved: Optional callback invoked (from the history
+                writer thread) after a transcription is saved to history.
         """
         self._database = database
         self._on_state_change = on_state_change
         self._on_error = on_error
         self._indicator = indicator
+        self._on_history_saved = on_history_saved
 
         # Initialize state
         self._state = AppState.IDLE
-        self._state_lock = threading.Lock()
+        # Reentrant so indicator and callback dispatch can run inside a transition
+        self._state_lock = threading.RLock()
+
+        # State change notifications, delivered in transition order by a
+        # runner thread so user callbacks never hold up a transition
+        self._callback_q: queue.Queue[Optional[AppState]] = queue.Queue()
+        self._callback_runner: Optional[threading.Thread] = None
 
         # Components (lazy initialized)
         self._hotkey_manager: Optional[HotkeyManager] = None
-        self._recorder: Optional[MicrophoneRecorder] = None
+        self._recorder: MicrophoneRecorder | _NoRecorder = _NO_RECORDER
         self._stt_engine: Optional[STTEngine] = None
         self._paster: Optional[ClipboardPaster] = None
 
+        # Runs paste_text off the worker thread so the PASTING -> IDLE
+        # transition does not wait for the keystroke and clipboard restore
+        self._paste_pool: Optional[ThreadPoolExecutor] = None
+
         # Current hotkey configuration
         self._current_hotkey: str = DEFAULT_HOTKEY
 
+        # Settings read on the transcription path, cached so each utterance
+        # does not query SQLite; written through by set_setting()
+        self._settings_cache: dict[str, Optional[str]] = {}
+
         # Recording state
         self._is_started = False
 
+        # Decodes the current recording while it is still being captured
+        self._decoder: Optional[StreamingDecoder] = None
+
+        # Cached microphone check; refreshed only while it is failing or
+        # after a recording fails to start
+        self._mic_ok = False
+        self._mic_error: Optional[str] = None
+
+        # Stopped recordings waiting for transcription, drained by a worker
+        # thread so the hotkey listener thread never blocks on STT inference
+        self._work_q: queue.Queue[Optional[tuple[MicrophoneRecorder, object, Optional[StreamingDecoder]]]] = (
+            queue.Queue()
+        )
+        self._worker: Optional[threading.Thread] = None
+
+        # Transcriptions waiting to be saved, written behind the paste so the
+        # SQLite commit is not on the user-visible path
+        self._history_q: queue.Queue[Optional[tuple[str, float]]] = queue.Queue()
+        self._history_writer: Optional[threading.Thread] = None
+
+        # Cleared while the STT model preloads in the background; set when
+        # the preload has finished (successfully or not)
+        self._stt_ready = threading.Event()
+        self._stt_ready.set()
+        self._stt_warmup: Optional[threading.Thread] = None
+
         logger.debug("VoiceInputController initialized")
 
     @property
@@ -123,8 +234,9 @@ class VoiceInputController:
         Returns:
             Current AppState (IDLE, RECORDING, TRANSCRIBING, PASTING, ERROR).
         """
-        with self._state_lock:
-            return self._state
+        # Reading a single attribute is atomic in CPython, so readers skip
+        # _state_lock; it only orders writers in _set_state_sequence
+        return self._state
 
     @property
     def is_recording(self) -> bool:
@@ -141,20 +253,43 @@ class VoiceInputController:
         Args:
             new_state: The new state to transition to
         """
+        self._set_state_sequence(new_state)
+
+    def _set_state_sequence(self, *states: AppState) -> None:
+        """Pass through one or more states in a single transition.
+
+        Each step is logged, but only the final state is stored, shown on the
+        indicator, and delivered to the state change callback, so momentary
+        states such as PASTING before IDLE do not cost a GUI update each.
+
+        Args:
+            states: States to pass through, in order
+        """
         with self._state_lock:
             old_state = self._state
+            for new_state in states:
+                logger.info("State transition: %s → %s", old_state.name, new_state.name)
+                old_state = new_state
             self._state = new_state
 
-        logger.info(f"State transition: {old_state.name} → {new_state.name}")
+            # Notify inside the lock so concurrent transitions are seen in order
+            self._update_indicator(new_state)
+            if self._callback_runner is None:
+                self._run_state_callback(new_state)
+            else:
+                self._callback_q.put(new_state)
 
-        # Update indicator based on state
-        self._update_indicator(new_state)
+    def _run_state_callback(self, state: AppState) -> None:
+        """Invoke the state change callback, logging any exception.
 
+        Args:
+            state: The state that was transitioned to
+        """
         if self._on_state_change:
             try:
-                self._on_state_change(new_state)
+                self._on_state_change(state)
             except Exception as e:
-                logger.error(f"Error in state change callback: {e}")
+                logger.error("Error in state change callback: %s", e)
 
     def _update_indicator(self, state: AppState) -> None:
         """Update the recording indicator based on application state.
@@ -165,41 +300,41 @@ class VoiceInputController:
         if self._indicator is None:
             return
 
-        # Map AppState to indicator state
-        indicator_state_map: dict[AppState, Literal["recording", "processing", "success", "error"]] = {
-            AppState.RECORDING: "recording",
-            AppState.TRANSCRIBING: "processing",
-            AppState.PASTING: "success",
-            AppState.ERROR: "error",
-        }
-
-        if state == AppState.IDLE:
-            # Hide indicator when idle
-            self._indicator.hide()
-        elif state in indicator_state_map:
-            indicator_state = indicator_state_map[state]
+        indicator_state = _INDICATOR_STATE_MAP.get(state)
+        if indicator_state is not None:
             if not self._indicator.is_visible:
                 self._indicator.show(indicator_state)
             else:
                 self._indicator.update_state(indicator_state)
+        elif state == AppState.IDLE:
+            # Hide indicator when idle
+            self._indicator.hide()
 
     def _notify_error(self, message: str) -> None:
-        """Notify error callback and transition to ERROR state.
+        """Notify error callback and recover through ERROR to IDLE.
+
+        The error reaches the user through the error callback, so ERROR is
+        only logged on the way back to IDLE rather than shown separately.
 
         Args:
             message: Error message to pass to callback
         """
-        logger.error(f"Error: {message}")
-        self._set_state(AppState.ERROR)
+        self._report_error(message)
+        self._set_state_sequence(AppState.ERROR, AppState.IDLE)
+
+    def _report_error(self, message: str) -> None:
+        """Log an error and pass it to the error callback without a state change.
+
+        Args:
+            message: Error message to pass to callback
+        """
+        logger.error("Error: %s", message)
 
         if self._on_error:
             try:
                 self._on_error(message)
             except Exception as e:
-                logger.error(f"Error in error callback: {e}")
-
-        # Auto-recover to IDLE after error notification
-        self._set_state(AppState.IDLE)
+                logger.error("Error in error callback: %s", e)
 
     def start(self) -> None:
         """Start the voice input controller.
@@ -214,14 +349,17 @@ class VoiceInputController:
         if self._is_started:
             raise RuntimeError("VoiceInputController is already started")
 
+        # Re-read settings that may have changed while stopped
+        self._settings_cache.clear()
+
         # Load hotkey from database
         stored_hotkey = self._database.get_setting("hotkey")
         if stored_hotkey:
             self._current_hotkey = stored_hotkey
         else:
             # Initialize default settings
-            self._database.set_setting("hotkey", DEFAULT_HOTKEY)
-            self._database.set_setting("restore_clipboard", "true")
+            self.set_setting("hotkey", DEFAULT_HOTKEY)
+            self.set_setting("restore_clipboard", "true")
 
         # Initialize components
         self._hotkey_manager = HotkeyManager()
@@ -230,17 +368,47 @@ class VoiceInputController:
         # Register hotkey for toggle
         self._hotkey_manager.register_hotkey(self._current_hotkey, self._on_hotkey_pressed)
 
+        # Check the microphone once, off the hotkey path
+        self._mic_ok, self._mic_error = check_microphone_available()
+
+        # Keep the microphone streaming into a ring buffer so a hotkey press
+        # starts capturing without waiting for the audio device to open
+        if self._mic_ok:
+            try:
+                self._recorder = MicrophoneRecorder()
+                self._recorder.open_stream()
+            except Exception as e:
+                logger.warning("Persistent microphone stream unavailable, opening per recording: %s", e)
+                self._recorder = _NO_RECORDER
+
+        # Load the STT model now so the first transcription does not pay for it
+        if self._stt_engine is None:
+            self._stt_ready.clear()
+            self._stt_warmup = threading.Thread(
+                target=self._warmup_stt, args=(STTEngine,), name="vox-stt-warmup", daemon=True
+            )
+            self._stt_warmup.start()
+
+        # Start the background threads before hotkey presses can enqueue work
+        self._callback_runner = self._start_queue_thread(
+            self._callback_q, self._run_state_callback, "vox-state-callbacks"
+        )
+        self._history_writer = self._start_queue_thread(self._history_q, self._save_history, "vox-history-writer")
+        self._paste_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vox-paste")
+        self._worker = self._start_queue_thread(self._work_q, self._process_audio, "vox-voice-worker")
+
         # Start listening
         self._hotkey_manager.start()
         self._is_started = True
 
-        logger.info(f"VoiceInputController started with hotkey: {self._current_hotkey}")
+        logger.info("VoiceInputController started with hotkey: %s", self._current_hotkey)
 
     def stop(self) -> None:
         """Stop the controller and release all resources.
 
         Cancels any in-progress recording, stops the hotkey listener,
-        hides the indicator, and cleans up all components.
+        waits for a running STT preload, hides the indicator, and cleans up
+        all components.
         Safe to call multiple times; subsequent calls are no-ops.
         """
         if not self._is_started:
@@ -255,18 +423,41 @@ class VoiceInputController:
             self._hotkey_manager.stop()
             self._hotkey_manager = None
 
+        # Let the worker finish any queued recording, then flush history writes
+        if self._worker:
+            self._stop_queue_thread(self._work_q, self._worker)
+            self._worker = None
+        if self._paste_pool:
+            self._paste_pool.shutdown(wait=True)
+            self._paste_pool = None
+        if self._history_writer:
+            self._stop_queue_thread(self._history_q, self._history_writer)
+            self._history_writer = None
+
         # Hide indicator (don't destroy - may be shared)
         if self._indicator:
             self._indicator.hide()
 
+        # Wait for a preload still in flight, so it cannot set the engine after
+        # it is released below or overlap the next start()'s preload
+        if self._stt_warmup:
+            self._stt_warmup.join()
+            self._stt_warmup = None
+
         # Cleanup components
-        self._recorder = None
+        self._recorder.close_stream()
+        self._recorder = _NO_RECORDER
         self._stt_engine = None
         self._paster = None
 
         self._is_started = False
         self._set_state(AppState.IDLE)
 
+        # Deliver the remaining state notifications, including the final IDLE
+        if self._callback_runner:
+            self._stop_queue_thread(self._callback_q, self._callback_runner)
+            self._callback_runner = None
+
         logger.info("VoiceInputController stopped")
 
     def trigger_recording(self) -> None:
@@ -291,13 +482,49 @@ class VoiceInputController:
 
         logger.info("Recording cancelled by user")
 
+        if self._decoder:
+            self._decoder.cancel()
+            self._decoder = None
+
         # Stop the recorder
-        if self._recorder:
+        try:
             self._recorder.stop_recording()
-            self._recorder = None
+        except MicrophoneError:
+            pass  # Nothing captured yet
+        if not self._recorder.is_stream_open:
+            self._recorder = _NO_RECORDER
 
         self._set_state(AppState.IDLE)
 
+    def set_setting(self, key: str, value: str) -> None:
+        """Persist a setting and update the controller's cached copy.
+
+        Settings the controller reads (such as ``restore_clipboard``) should
+        be changed through this method so the cache stays current.
+
+        Args:
+            key: Setting key
+            value: Setting value
+        """
+        self._database.set_setting(key, value)
+        self._settings_cache[key] = value
+
+    def _get_setting(self, key: str, default: str) -> str:
+        """Read a setting, querying the database only on first access.
+
+        Args:
+            key: Setting key
+            default: Value returned when the setting is not stored
+
+        Returns:
+            Setting value, or default if not found
+        """
+        try:
+            value = self._settings_cache[key]
+        except KeyError:
+            value = self._settings_cache[key] = self._database.get_setting(key)
+        return default if value is None else value
+
     def update_hotkey(self, new_hotkey: str) -> None:
         """Update the activation hotkey.
 
@@ -315,10 +542,14 @@ class VoiceInputController:
         """
         if not self._is_started:
             # Just update the stored value
-            self._database.set_setting("hotkey", new_hotkey)
+            self.set_setting("hotkey", new_hotkey)
             self._current_hotkey = new_hotkey
             return
 
+        # Validate before dropping the old hotkey; the parse is cached, so
+        # registering below does not repeat it
+        parse_hotkey(new_hotkey)
+
         # Unregister old hotkey
         if self._hotkey_manager:
             try:
@@ -330,105 +561,273 @@ class VoiceInputController:
             self._hotkey_manager.register_hotkey(new_hotkey, self._on_hotkey_pressed)
 
         # Persist to database
-        self._database.set_setting("hotkey", new_hotkey)
+        self.set_setting("hotkey", new_hotkey)
         self._current_hotkey = new_hotkey
 
-        logger.info(f"Hotkey updated to: {new_hotkey}")
+        logger.info("Hotkey updated to: %s", new_hotkey)
 
     def _on_hotkey_pressed(self) -> None:
         """Handle hotkey press - toggle recording state."""
         current_state = self.state
 
-        if current_state == AppState.IDLE:
-            # Start recording
-            self._start_recording()
-        elif current_state == AppState.RECORDING:
-            # Stop recording and process
-            self._stop_recording_and_process()
-        else:
+        handler = self._HOTKEY_ACTIONS.get(current_state)
+        if handler is None:
             # Busy with transcription or pasting, ignore
-            logger.debug(f"Hotkey ignored in state: {current_state.name}")
+            logger.debug("Hotkey ignored in state: %s", current_state.name)
+            return
+
+        handler(self)
 
     def _start_recording(self) -> None:
         """Start audio recording."""
         try:
-            # Check microphone availability first
-            is_available, error_msg = check_microphone_available()
-            if not is_available:
-                self._notify_error(error_msg or "No microphone available")
-                return
+            # Re-check the microphone only if the cached check failed
+            if not self._mic_ok:
+                self._mic_ok, self._mic_error = check_microphone_available()
+                if not self._mic_ok:
+                    self._notify_error(self._mic_error or "No microphone available")
+                    return
 
             self._set_state(AppState.RECORDING)
 
-            # Create a new recorder for this session
-            self._recorder = MicrophoneRecorder()
+            # Reuse the always-open recorder from start(), else open one for this session
+            if not self._recorder.is_stream_open:
+                self._recorder = MicrophoneRecorder()
             self._recorder.start_recording()
 
+            # With the model loaded and a persistent stream, start decoding
+            # while the user is still speaking
+            if self._recorder.is_stream_open and self._stt_ready.is_set() and self._stt_engine is not None:
+                self._decoder = StreamingDecoder(self._stt_engine, self._recorder)
+                self._decoder.start()
+
             logger.info("Recording started")
 
         except MicrophoneError as e:
+            # The device may have gone away; check again on the next press
+            self._mic_ok = False
             self._notify_error(f"Microphone error: {e.message}")
         except Exception as e:
+            self._mic_ok = False
             self._notify_error(f"Failed to start recording: {str(e)}")
 
     def _stop_recording_and_process(self) -> None:
-        """Stop recording, transcribe, and paste result."""
-        if not self._recorder:
+        """Stop recording and hand the audio to the processing worker.
+
+        Runs on the hotkey listener thread, so it only collects the recorded
+        audio; transcription, paste, and history persistence happen on the
+        worker thread started by `start()`.
+        """
+        recorder = self._recorder
+        decoder, self._decoder = self._decoder, None
+        if not recorder.is_recording:
             self._set_state(AppState.IDLE)
             return
+        if not recorder.is_stream_open:
+            # Per-session recorder; the next recording opens a new one
+            self._recorder = _NO_RECORDER
 
         try:
             # Stop recording - returns the audio data directly
-            audio_data = self._recorder.stop_recording()
+            audio_data = recorder.stop_recording()
+        except VoxError as e:
+            if decoder:
+                decoder.cancel()
+            self._notify_error(f"Error: {e.message}")
+            return
+        except Exception as e:
+            if decoder:
+                decoder.cancel()
+            self._notify_error(f"Processing failed: {str(e)}")
+            return
 
-            if audio_data is None or len(audio_data) == 0:
-                logger.warning("No audio data recorded")
-                self._notify_error("No audio recorded")
-                return
+        if audio_data is None or len(audio_data) == 0:
+            if decoder:
+                decoder.cancel()
+            logger.warning("No audio data recorded")
+            self._notify_error("No audio recorded")
+            return
+
+        # Leave RECORDING right away so further presses are ignored while busy.
+        # audio_data may be a view of the recorder's scratch buffer; it is only
+        # read before the worker returns to IDLE, so no later recording can
+        # overwrite it while it is in use.
+        self._set_state(AppState.TRANSCRIBING)
+
+        if self._worker is None:
+            self._process_audio(recorder, audio_data, decoder)
+        else:
+            self._work_q.put((recorder, audio_data, decoder))
+
+    # Hotkey toggle: IDLE starts recording, RECORDING stops and processes
+    _HOTKEY_ACTIONS: Final[dict[AppState, Callable[["VoiceInputController"], None]]] = {
+        AppState.IDLE: _start_recording,
+        AppState.RECORDING: _stop_recording_and_process,
+    }
+
+    def _warmup_stt(self, engine_class: type[STTEngine]) -> None:
+        """Construct and warm up the STT engine off the caller's thread.
+
+        If loading fails the engine stays unset, so the first transcription
+        retries the load and reports the error to the user.
+
+        Args:
+            engine_class: STT engine class to instantiate.
+        """
+        try:
+            engine = engine_class()
+            engine.warmup()
+            self._stt_engine = engine
+            logger.info("STT engine preloaded")
+        except Exception as e:
+            logger.warning("STT engine preload failed: %s", e)
+        finally:
+            self._stt_ready.set()
+
+    @staticmethod
+    def _start_queue_thread(work_q: queue.Queue, handler: Callable[..., Any], name: str) -> threading.Thread:
+        """Start a daemon thread that passes queued items to a handler.
+
+        The thread exits on the `None` sentinel queued by `_stop_queue_thread`.
+        Tuple items are unpacked into the handler's arguments.
+
+        Args:
+            work_q: Queue to drain
+            handler: Function called for each item
+            name: Thread name
 
-            self._set_state(AppState.TRANSCRIBING)
+        Returns:
+            The started thread
+        """
+
+        def drain() -> None:
+            while True:
+                item = work_q.get()
+                try:
+                    if item is None:
+                        return
+                    if isinstance(item, tuple):
+                        handler(*item)
+                    else:
+                        handler(item)
+                finally:
+                    work_q.task_done()
+
+        thread = threading.Thread(target=drain, name=name, daemon=True)
+        thread.start()
+        return thread
+
+    @staticmethod
+    def _stop_queue_thread(work_q: queue.Queue, thread: threading.Thread) -> None:
+        """Let a queue thread finish pending items, then wait for it to exit.
 
-            # Save to temp file for transcription
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                temp_path = Path(temp_file.name)
-                self._recorder.save_wav(audio_data, temp_path)
+        Args:
+            work_q: Queue the thread drains
+            thread: Thread started by `_start_queue_thread`
+        """
+        work_q.put(None)
+        if thread is not threading.current_thread():
+            thread.join()
 
-            # Lazy load STT engine
-            if self._stt_engine is None:
-                self._stt_engine = STTEngine()
+    def _save_history(self, text: str, duration: float) -> None:
+        """Add a transcription to history and notify the saved callback.
 
-            # Transcribe
-            transcribed_text = self._stt_engine.transcribe_audio(temp_path)
+        The text has already been pasted, so a failed write is logged rather
+        than reported to the user as a failed transcription.
 
-            # Cleanup temp file
+        Args:
+            text: Transcribed text
+            duration: Recording duration in seconds
+        """
+        try:
+            self._database.add_transcription(text=text, duration_seconds=duration)
+        except Exception as e:
+            logger.error("Failed to save transcription to history: %s", e)
+            return
+
+        if self._on_history_saved:
             try:
-                temp_path.unlink()
-            except Exception:
-                pass
+                self._on_history_saved()
+            except Exception as e:
+                logger.error("Error in history saved callback: %s", e)
+
+    def _on_paste_done(self, future: Future) -> None:
+        """Report a failed background paste.
 
-            if not transcribed_text or not transcribed_text.strip():
+        The controller is already IDLE when the paste finishes, so a failure
+        only moves through ERROR if no new recording has started since.
+
+        Args:
+            future: Completed future from the paste executor
+        """
+        exc = future.exception()
+        if exc is None:
+            return
+
+        message = f"Error: {exc.message}" if isinstance(exc, VoxError) else f"Paste failed: {str(exc)}"
+        with self._state_lock:
+            if self._state == AppState.IDLE:
+                self._notify_error(message)
+                return
+
+        self._report_error(message)
+
+    def _process_audio(
+        self, recorder: MicrophoneRecorder, audio_data, decoder: Optional[StreamingDecoder] = None
+    ) -> None:
+        """Transcribe recorded audio, paste the result, and save it to history.
+
+        Args:
+            recorder: Recorder that captured the audio (for its sample rate).
+            audio_data: Recorded samples returned by `stop_recording()`.
+            decoder: Decoder that transcribed the recording while it was
+                captured, if any; only the audio it has not committed is
+                transcribed here.
+        """
+        try:
+            # Wait for the preload started by start(); load here if it failed
+            self._stt_ready.wait()
+            stt = self._stt_engine
+            if stt is None:
+                stt = self._stt_engine = STTEngine()
+
+            sample_rate = recorder.sample_rate
+            paster, paste_pool = self._paster, self._paste_pool
+
+            # Transcribe the recorded samples directly, without a temp WAV file
+            if decoder is not None:
+                transcribed_text = decoder.finish(audio_data)
+            else:
+                transcribed_text = stt.transcribe_array(audio_data, sample_rate)
+
+            text = transcribed_text.strip() if transcribed_text else ""
+            if not text:
                 logger.warning("Empty transcription result")
                 self._notify_error("Could not transcribe audio")
                 return
 
             # Calculate duration from audio data
-            sample_rate = self._recorder.sample_rate
             duration = len(audio_data) / sample_rate
 
             # Paste the transcribed text
-            self._set_state(AppState.PASTING)
+            restore_clipboard = self._get_setting("restore_clipboard", "true") == "true"
 
-            restore_clipboard = self._database.get_setting("restore_clipboard", "true") == "true"
-
-            if self._paster:
-                self._paster.paste_text(transcribed_text.strip(), restore_clipboard=restore_clipboard)
+            if paster and paste_pool:
+                future = paste_pool.submit(paster.paste_text, text, restore_clipboard=restore_clipboard)
+                future.add_done_callback(self._on_paste_done)
+            elif paster:
+                paster.paste_text(text, restore_clipboard=restore_clipboard)
 
             # Save to history
-            self._database.add_transcription(text=transcribed_text.strip(), duration_seconds=duration)
+            if self._history_writer is None:
+                self._save_history(text, duration)
+            else:
+                self._history_q.put((text, duration))
 
-            logger.info(f"Transcription complete: {len(transcribed_text)} chars, {duration:.1f}s recording")
+            logger.info("Transcription complete: %s chars, %.1fs recording", len(transcribed_text), duration)
 
-            self._set_state(AppState.IDLE)
+            # The paste runs in the background, so PASTING is momentary
+            self._set_state_sequence(AppState.PASTING, AppState.IDLE)
 
         except TranscriptionError as e:
             self._notify_error(f"Transcription error: {e.message}")
@@ -436,5 +835,3 @@ class VoiceInputController:
             self._notify_error(f"Error: {e.message}")
         except Exception as e:
             self._notify_error(f"Processing failed: {str(e)}")
-        finally:
-            self._recorder = None
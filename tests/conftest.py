@@ -0,0 +1,38 @@
+"""Shared pytest configuration for the vox test suite."""
+
+import os
+
+import pytest
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_auto_num_workers(config: pytest.Config) -> int:
+    """Size ``-n auto`` to all but two cores, leaving headroom for the foreground.
+
+    Args:
+        config: pytest configuration
+
+    Returns:
+        Number of xdist workers to start
+    """
+    return max(1, (os.cpu_count() or 1) - 2)
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register the ``--runslow`` opt-in for tests marked ``slow``."""
+    parser.addoption("--runslow", action="store_true", default=False, help="run tests marked slow")
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip ``slow`` tests unless ``--runslow`` was given.
+
+    Args:
+        config: pytest configuration
+        items: collected test items
+    """
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow; pass --runslow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
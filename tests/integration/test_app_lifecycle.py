@@ -5,11 +5,65 @@ Tests cover:
 - Window creation and display
 """
 
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Iterator, NamedTuple
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.persistence.database import VoxDatabase
+from src.ui.main_window import VoxMainWindow
 
+
+def _mock_database() -> MagicMock:
+    """Create a plain database mock; spec introspection adds nothing here."""
+    db = MagicMock()
+    db.get_setting.return_value = "<ctrl>+<alt>+space"
+    return db
+
+
+def _mock_controller() -> SimpleNamespace:
+    """Create a controller stand-in with only what VoxMainWindow touches."""
+    return SimpleNamespace(
+        start=MagicMock(),
+        stop=MagicMock(),
+        trigger_recording=MagicMock(),
+        set_setting=MagicMock(),
+        update_hotkey=MagicMock(),
+        _on_state_change=None,
+        _on_error=None,
+        _indicator=None,
+        _on_history_saved=None,
+    )
+
+
+class _MainWindowHarness(NamedTuple):
+    """A VoxMainWindow built on mocks, with the mocks it was built from."""
+
+    window: VoxMainWindow
+    mock_ttk: MagicMock
+    mock_window: MagicMock
+    controller: SimpleNamespace
+    database: MagicMock
+
+
+@pytest.fixture
+def main_window() -> Iterator[_MainWindowHarness]:
+    """Create a VoxMainWindow with ttkbootstrap and its collaborators mocked."""
+    with patch("src.ui.main_window.ttk") as mock_ttk, patch("src.ui.main_window.configure_styles"):
+        mock_window = MagicMock()
+        mock_ttk.Window.return_value = mock_window
+
+        controller = _mock_controller()
+        database = _mock_database()
+        window = VoxMainWindow(controller=controller, database=database)
+
+        yield _MainWindowHarness(window, mock_ttk, mock_window, controller, database)
+
+
+@pytest.mark.skip(reason="ttkbootstrap widgets cannot be properly mocked")
 class TestApplicationLifecycle:
     """Tests for application launch and GUI.
 
@@ -17,121 +71,25 @@ class TestApplicationLifecycle:
     properly mocked - they require actual tkinter/tcl initialization.
     """
 
-    @pytest.mark.skip(reason="ttkbootstrap widgets cannot be properly mocked")
-    @patch("src.ui.main_window.ttk")
-    @patch("src.ui.main_window.configure_styles")
-    def test_app_initializes_components(
-        self,
-        mock_configure_styles: MagicMock,
-        mock_ttk: MagicMock,
-    ) -> None:
+    def test_app_initializes_components(self, main_window: _MainWindowHarness) -> None:
         """Application should initialize database, controller, and window."""
-        from src.persistence.database import VoxDatabase
-        from src.ui.main_window import VoxMainWindow
-        from src.voice_input.controller import VoiceInputController
+        main_window.mock_ttk.Window.assert_called_once()
+        assert main_window.window._controller is main_window.controller
+        assert main_window.window._database is main_window.database
 
-        # Create mocks
-        mock_window = MagicMock()
-        mock_ttk.Window.return_value = mock_window
-        mock_window.style = MagicMock()
-
-        mock_db = MagicMock(spec=VoxDatabase)
-        mock_db.get_setting.return_value = "<ctrl>+<alt>+space"
-
-        mock_controller = MagicMock(spec=VoiceInputController)
-        mock_controller._on_state_change = None
-        mock_controller._on_error = None
-        mock_controller._on_error = None
-        mock_controller._indicator = None
-
-        # Create main window
-        window = VoxMainWindow(
-            controller=mock_controller,
-            database=mock_db,
-        )
-
-        # Verify window was created
-        mock_ttk.Window.assert_called_once()
-        assert window._controller is mock_controller
-        assert window._database is mock_db
-
-    @pytest.mark.skip(reason="ttkbootstrap widgets cannot be properly mocked")
-    @patch("src.ui.main_window.ttk")
-    @patch("src.ui.main_window.configure_styles")
-    def test_show_displays_window(
-        self,
-        mock_configure_styles: MagicMock,
-        mock_ttk: MagicMock,
-    ) -> None:
+    def test_show_displays_window(self, main_window: _MainWindowHarness) -> None:
         """show() should display the window."""
-        from src.persistence.database import VoxDatabase
-        from src.ui.main_window import VoxMainWindow
-        from src.voice_input.controller import VoiceInputController
+        main_window.window.show()
 
-        # Create mocks
-        mock_window = MagicMock()
-        mock_ttk.Window.return_value = mock_window
-        mock_window.style = MagicMock()
-
-        mock_db = MagicMock(spec=VoxDatabase)
-        mock_db.get_setting.return_value = "<ctrl>+<alt>+space"
-
-        mock_controller = MagicMock(spec=VoiceInputController)
-        mock_controller._on_state_change = None
-        mock_controller._on_error = None
-        mock_controller._indicator = None
-
-        # Create main window
-        window = VoxMainWindow(
-            controller=mock_controller,
-            database=mock_db,
-        )
-
-        # Call show
-        window.show()
-
-        # Verify window methods called
-        mock_window.deiconify.assert_called()
-        mock_window.lift.assert_called()
-
-    @pytest.mark.skip(reason="ttkbootstrap widgets cannot be properly mocked")
-    @patch("src.ui.main_window.ttk")
-    @patch("src.ui.main_window.configure_styles")
-    def test_hide_withdraws_window(
-        self,
-        mock_configure_styles: MagicMock,
-        mock_ttk: MagicMock,
-    ) -> None:
-        """hide() should withdraw the window."""
-        from src.persistence.database import VoxDatabase
-        from src.ui.main_window import VoxMainWindow
-        from src.voice_input.controller import VoiceInputController
-
-        # Create mocks
-        mock_window = MagicMock()
-        mock_ttk.Window.return_value = mock_window
-        mock_window.style = MagicMock()
-
-        mock_db = MagicMock(spec=VoxDatabase)
-        mock_db.get_setting.return_value = "<ctrl>+<alt>+space"
-
-        mock_controller = MagicMock(spec=VoiceInputController)
-        mock_controller._on_state_change = None
-        mock_controller._on_error = None
-        mock_controller._indicator = None
+        main_window.mock_window.deiconify.assert_called()
+        main_window.mock_window.lift.assert_called()
 
-        # Create main window
-        window = VoxMainWindow(
-            controller=mock_controller,
-            database=mock_db,
-        )
-
-        # Call hide
-        window.hide()
+    def test_hide_withdraws_window(self, main_window: _MainWindowHarness) -> None:
+        """hide() should withdraw the window."""
+        main_window.window.hide()
 
-        # Verify window was withdrawn
-        mock_window.withdraw.assert_called()
-        assert window._is_minimized_to_tray is True
+        main_window.mock_window.withdraw.assert_called()
+        assert main_window.window._is_minimized_to_tray is True
 
 
 class TestThemePersistence:
@@ -139,11 +97,6 @@ class TestThemePersistence:
 
     def test_theme_setting_persists_in_database(self) -> None:
         """Theme setting should persist to database."""
-        import tempfile
-        from pathlib import Path
-
-        from src.persistence.database import VoxDatabase
-
         # Use a temp directory for the database
         with tempfile.TemporaryDirectory() as tmpdir:
             db_path = Path(tmpdir) / "test_theme.db"
@@ -160,11 +113,6 @@ class TestThemePersistence:
 
     def test_theme_setting_restored_on_reconnect(self) -> None:
         """Theme setting should be restored when database is reopened."""
-        import tempfile
-        from pathlib import Path
-
-        from src.persistence.database import VoxDatabase
-
         # Use a temp directory for the database
         with tempfile.TemporaryDirectory() as tmpdir:
             db_path = Path(tmpdir) / "test_theme.db"
@@ -182,11 +130,6 @@ class TestThemePersistence:
 
     def test_default_theme_when_no_saved_preference(self) -> None:
         """Should return default theme (cosmo) when no preference is saved."""
-        import tempfile
-        from pathlib import Path
-
-        from src.persistence.database import VoxDatabase
-
         # Use a temp directory for the database
         with tempfile.TemporaryDirectory() as tmpdir:
             db_path = Path(tmpdir) / "test_theme.db"
@@ -3,86 +3,107 @@
 Tests for T085: Error recovery flow in the voice input system.
 """
 
-import tempfile
 from pathlib import Path
+from types import SimpleNamespace
+from typing import Iterator
 from unittest.mock import MagicMock, patch
 
+import numpy as np
+import pytest
+
 from src.persistence.database import VoxDatabase
 from src.persistence.models import AppState
+from src.utils.errors import TranscriptionError
 from src.voice_input.controller import VoiceInputController
 
+# The STT mock raises before reading the samples, so one silent sample will do
+_EMPTY_AUDIO = np.zeros(1, dtype=np.float32)
+
+
+@pytest.fixture(autouse=True)
+def mock_stt_preload():
+    """Keep start() from loading a real Whisper model in the background."""
+    with patch("src.voice_input.controller.STTEngine") as mock_stt_class:
+        yield mock_stt_class
+
+
+@pytest.fixture(scope="module")
+def database() -> Iterator[VoxDatabase]:
+    """One in-memory database for the module; these tests only read settings from it."""
+    db = VoxDatabase(db_path=Path(":memory:"))
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def controller_deps(mock_stt_preload: MagicMock) -> Iterator[SimpleNamespace]:
+    """Patch the controller's hardware-facing collaborators for one test."""
+    with (
+        patch("src.voice_input.controller.HotkeyManager") as mock_hotkey_class,
+        patch("src.voice_input.controller.ClipboardPaster") as mock_paster_class,
+        patch("src.voice_input.controller.check_microphone_available") as mock_check_mic,
+        patch("src.voice_input.controller.MicrophoneRecorder") as mock_recorder_class,
+    ):
+        yield SimpleNamespace(
+            hotkey=mock_hotkey_class,
+            paster=mock_paster_class,
+            check_mic=mock_check_mic,
+            recorder=mock_recorder_class,
+            stt=mock_stt_preload,
+        )
+
 
 class TestErrorRecoveryFlow:
     """Integration tests for error recovery scenarios."""
 
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = Path(self.temp_dir) / "test_error.db"
-        self.database = VoxDatabase(db_path=self.db_path)
-
-    def teardown_method(self) -> None:
-        """Clean up after tests."""
-        self.database.close()
-        if self.db_path.exists():
-            self.db_path.unlink()
-        Path(self.temp_dir).rmdir()
-
-    @patch("src.voice_input.controller.HotkeyManager")
-    @patch("src.voice_input.controller.ClipboardPaster")
-    @patch("src.voice_input.controller.check_microphone_available")
-    def test_full_error_recovery_cycle(
-        self,
-        mock_check_mic: MagicMock,
-        mock_paster_class: MagicMock,
-        mock_hotkey_class: MagicMock,
+    @pytest.mark.parametrize(
+        ("attempts", "callback_raises"),
+        [(1, False), (3, False), (1, True)],
+        ids=["single-error", "repeated-errors", "callback-raises"],
+    )
+    def test_error_recovery(
+        self, controller_deps: SimpleNamespace, database: VoxDatabase, attempts: int, callback_raises: bool
     ) -> None:
-        """Test complete error recovery cycle: error -> recovery -> ready."""
-        mock_check_mic.return_value = (False, "No microphone detected")
+        """Each failed attempt reports one error and returns to IDLE, even if the callback raises."""
+        controller_deps.check_mic.return_value = (False, "No microphone detected")
 
         states: list[AppState] = []
         errors: list[str] = []
 
-        controller = VoiceInputController(
-            database=self.database,
-            on_state_change=lambda s: states.append(s),
-            on_error=lambda e: errors.append(e),
-        )
+        def on_error(message: str) -> None:
+            errors.append(message)
+            if callback_raises:
+                raise ValueError("Callback error!")
+
+        controller = VoiceInputController(database=database, on_state_change=states.append, on_error=on_error)
         controller.start()
 
-        # Trigger recording (will fail due to no mic)
-        controller.trigger_recording()
+        # Every attempt fails on the microphone check and recovers at once
+        for _ in range(attempts):
+            controller.trigger_recording()
+            assert controller.state == AppState.IDLE
+        controller._callback_q.join()
 
-        # Verify error flow
-        assert AppState.ERROR in states
-        assert len(errors) == 1
+        # ERROR is passed through, so each attempt notifies only IDLE
+        assert states == [AppState.IDLE] * attempts
+        assert len(errors) == attempts
         assert "microphone" in errors[0].lower()
 
-        # Verify recovery to IDLE
-        assert controller.state == AppState.IDLE
-
-    @patch("src.voice_input.controller.HotkeyManager")
-    @patch("src.voice_input.controller.ClipboardPaster")
-    @patch("src.voice_input.controller.check_microphone_available")
-    @patch("src.voice_input.controller.MicrophoneRecorder")
     def test_error_does_not_block_subsequent_recordings(
-        self,
-        mock_recorder_class: MagicMock,
-        mock_check_mic: MagicMock,
-        mock_paster_class: MagicMock,
-        mock_hotkey_class: MagicMock,
+        self, controller_deps: SimpleNamespace, database: VoxDatabase
     ) -> None:
         """Test that error recovery allows new recording attempts."""
-        # First call fails, second succeeds
-        mock_check_mic.side_effect = [
+        # Checks at start() and on the first press fail, the next one succeeds
+        controller_deps.check_mic.side_effect = [
+            (False, "No microphone"),
             (False, "No microphone"),
             (True, None),
         ]
 
         mock_recorder = MagicMock()
-        mock_recorder_class.return_value = mock_recorder
+        controller_deps.recorder.return_value = mock_recorder
 
-        controller = VoiceInputController(database=self.database)
+        controller = VoiceInputController(database=database)
         controller.start()
 
         # First attempt fails
@@ -93,116 +114,29 @@ class TestErrorRecoveryFlow:
         controller.trigger_recording()
         assert controller.state == AppState.RECORDING
 
-    @patch("src.voice_input.controller.HotkeyManager")
-    @patch("src.voice_input.controller.ClipboardPaster")
-    @patch("src.voice_input.controller.check_microphone_available")
-    @patch("src.voice_input.controller.MicrophoneRecorder")
-    def test_multiple_errors_handled_gracefully(
-        self,
-        mock_recorder_class: MagicMock,
-        mock_check_mic: MagicMock,
-        mock_paster_class: MagicMock,
-        mock_hotkey_class: MagicMock,
-    ) -> None:
-        """Test that multiple consecutive errors are handled gracefully."""
-        mock_check_mic.return_value = (False, "No microphone")
-
-        error_count = 0
-
-        def count_error(msg: str) -> None:
-            nonlocal error_count
-            error_count += 1
-
-        controller = VoiceInputController(database=self.database, on_error=count_error)
-        controller.start()
-
-        # Multiple failed attempts
-        for _ in range(3):
-            controller.trigger_recording()
-            assert controller.state == AppState.IDLE
-
-        assert error_count == 3
-
-    @patch("src.voice_input.controller.HotkeyManager")
-    @patch("src.voice_input.controller.ClipboardPaster")
-    @patch("src.voice_input.controller.check_microphone_available")
-    @patch("src.voice_input.controller.MicrophoneRecorder")
-    def test_error_callback_exception_does_not_crash(
-        self,
-        mock_recorder_class: MagicMock,
-        mock_check_mic: MagicMock,
-        mock_paster_class: MagicMock,
-        mock_hotkey_class: MagicMock,
-    ) -> None:
-        """Test that exception in error callback doesn't crash controller."""
-        mock_check_mic.return_value = (False, "No microphone")
-
-        def bad_callback(msg: str) -> None:
-            raise ValueError("Callback error!")
-
-        controller = VoiceInputController(database=self.database, on_error=bad_callback)
-        controller.start()
-
-        # Should not crash despite callback exception
-        controller.trigger_recording()
-        assert controller.state == AppState.IDLE
-
 
 class TestErrorIndicatorIntegration:
     """Integration tests for error indicator display."""
 
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = Path(self.temp_dir) / "test_indicator.db"
-        self.database = VoxDatabase(db_path=self.db_path)
-
-    def teardown_method(self) -> None:
-        """Clean up after tests."""
-        self.database.close()
-        if self.db_path.exists():
-            self.db_path.unlink()
-        Path(self.temp_dir).rmdir()
-
-    @patch("src.voice_input.controller.HotkeyManager")
-    @patch("src.voice_input.controller.ClipboardPaster")
-    @patch("src.voice_input.controller.check_microphone_available")
-    def test_indicator_shows_error_then_hides(
-        self,
-        mock_check_mic: MagicMock,
-        mock_paster_class: MagicMock,
-        mock_hotkey_class: MagicMock,
-    ) -> None:
-        """Test that indicator shows error state then hides on recovery."""
-        mock_check_mic.return_value = (False, "No microphone")
+    def test_indicator_hides_on_error(self, controller_deps: SimpleNamespace, database: VoxDatabase) -> None:
+        """Test that the indicator is hidden once on recovery, without an error flash."""
+        controller_deps.check_mic.return_value = (False, "No microphone")
 
         mock_indicator = MagicMock()
         mock_indicator.is_visible = False
 
-        controller = VoiceInputController(database=self.database, indicator=mock_indicator)
+        controller = VoiceInputController(database=database, indicator=mock_indicator)
         controller.start()
 
         controller.trigger_recording()
 
-        # Should have shown error
-        mock_indicator.show.assert_called()
-        call_args = [call[0][0] for call in mock_indicator.show.call_args_list]
-        assert "error" in call_args
-
-        # Should hide when returning to IDLE
-        mock_indicator.hide.assert_called()
-
-    @patch("src.voice_input.controller.HotkeyManager")
-    @patch("src.voice_input.controller.ClipboardPaster")
-    @patch("src.voice_input.controller.check_microphone_available")
-    def test_indicator_cycles_through_states_on_error(
-        self,
-        mock_check_mic: MagicMock,
-        mock_paster_class: MagicMock,
-        mock_hotkey_class: MagicMock,
-    ) -> None:
+        # ERROR collapses into the return to IDLE
+        mock_indicator.show.assert_not_called()
+        mock_indicator.hide.assert_called_once()
+
+    def test_indicator_updated_once_on_error(self, controller_deps: SimpleNamespace, database: VoxDatabase) -> None:
         """Test indicator state transitions during error flow."""
-        mock_check_mic.return_value = (False, "No microphone")
+        controller_deps.check_mic.return_value = (False, "No microphone")
 
         indicator_states: list[str] = []
         mock_indicator = MagicMock()
@@ -213,54 +147,30 @@ class TestErrorIndicatorIntegration:
 
         mock_indicator.update_state.side_effect = track_update_state
 
-        controller = VoiceInputController(database=self.database, indicator=mock_indicator)
+        controller = VoiceInputController(database=database, indicator=mock_indicator)
         controller.start()
 
         controller.trigger_recording()
 
-        # Should have transitioned through error state
-        assert "error" in indicator_states
+        # Only the final IDLE reaches the indicator
+        assert indicator_states == []
+        mock_indicator.hide.assert_called_once()
 
 
 class TestTranscriptionErrorHandling:
     """Integration tests for transcription-related errors."""
 
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = Path(self.temp_dir) / "test_transcription.db"
-        self.database = VoxDatabase(db_path=self.db_path)
-
-    def teardown_method(self) -> None:
-        """Clean up after tests."""
-        self.database.close()
-        if self.db_path.exists():
-            self.db_path.unlink()
-        Path(self.temp_dir).rmdir()
-
-    @patch("src.voice_input.controller.HotkeyManager")
-    @patch("src.voice_input.controller.ClipboardPaster")
-    @patch("src.voice_input.controller.check_microphone_available")
-    @patch("src.voice_input.controller.MicrophoneRecorder")
-    @patch("src.voice_input.controller.STTEngine")
-    def test_empty_audio_triggers_error(
-        self,
-        mock_stt_class: MagicMock,
-        mock_recorder_class: MagicMock,
-        mock_check_mic: MagicMock,
-        mock_paster_class: MagicMock,
-        mock_hotkey_class: MagicMock,
-    ) -> None:
+    def test_empty_audio_triggers_error(self, controller_deps: SimpleNamespace, database: VoxDatabase) -> None:
         """Test that empty audio data triggers appropriate error."""
-        mock_check_mic.return_value = (True, None)
+        controller_deps.check_mic.return_value = (True, None)
 
         mock_recorder = MagicMock()
         mock_recorder.get_audio_data.return_value = None  # No audio
-        mock_recorder_class.return_value = mock_recorder
+        controller_deps.recorder.return_value = mock_recorder
 
         errors: list[str] = []
 
-        controller = VoiceInputController(database=self.database, on_error=lambda e: errors.append(e))
+        controller = VoiceInputController(database=database, on_error=lambda e: errors.append(e))
         controller.start()
 
         # Start and stop recording
@@ -270,42 +180,27 @@ class TestTranscriptionErrorHandling:
         assert len(errors) >= 1
         assert "audio" in errors[-1].lower() or "recorded" in errors[-1].lower()
 
-    @patch("src.voice_input.controller.HotkeyManager")
-    @patch("src.voice_input.controller.ClipboardPaster")
-    @patch("src.voice_input.controller.check_microphone_available")
-    @patch("src.voice_input.controller.MicrophoneRecorder")
-    @patch("src.voice_input.controller.STTEngine")
-    def test_stt_exception_triggers_error(
-        self,
-        mock_stt_class: MagicMock,
-        mock_recorder_class: MagicMock,
-        mock_check_mic: MagicMock,
-        mock_paster_class: MagicMock,
-        mock_hotkey_class: MagicMock,
-    ) -> None:
+    def test_stt_exception_triggers_error(self, controller_deps: SimpleNamespace, database: VoxDatabase) -> None:
         """Test that STT engine exception triggers error notification."""
-        import numpy as np
-
-        from src.utils.errors import TranscriptionError
-
-        mock_check_mic.return_value = (True, None)
+        controller_deps.check_mic.return_value = (True, None)
 
         mock_recorder = MagicMock()
-        mock_recorder.get_audio_data.return_value = np.zeros(1000)
+        mock_recorder.get_audio_data.return_value = _EMPTY_AUDIO
         mock_recorder.save_to_file.return_value = None
-        mock_recorder_class.return_value = mock_recorder
+        controller_deps.recorder.return_value = mock_recorder
 
         mock_stt = MagicMock()
-        mock_stt.transcribe_audio.side_effect = TranscriptionError("Model failed", error_code="MODEL_ERROR")
-        mock_stt_class.return_value = mock_stt
+        mock_stt.transcribe_array.side_effect = TranscriptionError("Model failed", error_code="MODEL_ERROR")
+        controller_deps.stt.return_value = mock_stt
 
         errors: list[str] = []
 
-        controller = VoiceInputController(database=self.database, on_error=lambda e: errors.append(e))
+        controller = VoiceInputController(database=database, on_error=lambda e: errors.append(e))
         controller.start()
 
         controller._start_recording()
         controller._stop_recording_and_process()
+        controller._work_q.join()
 
         assert len(errors) >= 1
         # Should have recovered to IDLE
@@ -4,11 +4,12 @@ These tests verify the complete flow from tab detection through
 text extraction to audio synthesis and playback.
 """
 
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import Mock, patch
 
 import pytest
 
 from src.browser.tab_info import TabInfo
+from src.tts.playback import AudioPlayback
 from src.utils.errors import ExtractionError, TTSError
 
 
@@ -107,24 +108,18 @@ class TestFullTabToSpeechFlow:
 
     def test_playback_pause_resume(self):
         """Start audio playback, pause, and resume from same position."""
-        with patch("src.tts.playback.AudioPlayback") as mock_player:
-            # Setup mock player
-            player_instance = MagicMock()
-            mock_player.return_value = player_instance
-
-            # Mock methods
-            player_instance.play_audio = Mock()
-            player_instance.pause = Mock()
-            player_instance.resume = Mock()
-            player_instance.get_position = Mock(return_value=2.5)
+        # A spec'd Mock rejects misspelled methods and skips MagicMock's magic-method setup
+        player_instance = Mock(spec=AudioPlayback)
+        player_instance.get_position.return_value = 2.5
 
+        with patch("src.tts.playback.AudioPlayback", return_value=player_instance):
             # Create test audio
             test_audio = b"audio_data"
 
-            from src.tts.playback import AudioPlayback
+            from src.tts import playback
 
             # Create player and play
-            player = AudioPlayback()
+            player = playback.AudioPlayback()
             player.play_audio(test_audio)
             assert player_instance.play_audio.called
 
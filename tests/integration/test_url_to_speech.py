@@ -2,7 +2,8 @@
 
 import os
 import tempfile
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
@@ -13,6 +14,11 @@ from src.tts.synthesizer import PiperSynthesizer
 from src.utils.errors import FileLoadError, URLFetchError
 
 
+def _ok_response(html: str) -> SimpleNamespace:
+    """A 200 response carrying ``html``, with only the fields fetch_url() reads."""
+    return SimpleNamespace(status_code=200, text=html, encoding="utf-8", raise_for_status=lambda: None)
+
+
 class TestURLToSpeechIntegration:
     """Integration test suite for URL and file-based reading workflows."""
 
@@ -21,9 +27,7 @@ class TestURLToSpeechIntegration:
     def test_full_url_read_flow(self, mock_get, mock_synthesize):
         """Test complete flow: fetch URL, extract text, synthesize, playback."""
         # Mock URL fetch
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = """
+        page = """
             <html>
             <head><title>Test Page</title></head>
             <body>
@@ -33,8 +37,7 @@ class TestURLToSpeechIntegration:
             </body>
             </html>
         """
-        mock_response.encoding = "utf-8"
-        mock_get.return_value = mock_response
+        mock_get.return_value = _ok_response(page)
 
         # Mock TTS synthesis
         mock_audio_bytes = b"mock audio data"
@@ -91,8 +94,7 @@ class TestURLToSpeechIntegration:
         finally:
             os.unlink(tmp_path)
 
-    @patch("src.tts.synthesizer.synthesize_piper")
-    def test_complex_webpage_extraction(self, mock_synthesize):
+    def test_complex_webpage_extraction(self):
         """Test extraction from complex webpage with nav/header/footer prioritizing main content."""
         html_content = """
             <html>
@@ -169,8 +171,7 @@ class TestURLToSpeechIntegration:
 
         assert "timeout" in str(exc_info.value).lower()
 
-    @patch("src.tts.synthesizer.synthesize_piper")
-    def test_text_extraction_preserves_order(self, mock_synthesize):
+    def test_text_extraction_preserves_order(self):
         """Test that text extraction preserves reading order."""
         html_content = """
             <html>
@@ -199,9 +200,7 @@ class TestURLToSpeechIntegration:
     @patch("src.extraction.url_fetcher.requests.get")
     def test_url_to_speech_with_unicode_content(self, mock_get, mock_synthesize):
         """Test URL-to-speech with unicode characters and special symbols."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.text = """
+        page = """
             <html>
             <body>
                 <h1>Unicode Test: Café français</h1>
@@ -210,8 +209,7 @@ class TestURLToSpeechIntegration:
             </body>
             </html>
         """
-        mock_response.encoding = "utf-8"
-        mock_get.return_value = mock_response
+        mock_get.return_value = _ok_response(page)
 
         mock_synthesize.return_value = b"audio data"
 
@@ -249,8 +247,7 @@ class TestURLToSpeechIntegration:
         finally:
             os.unlink(tmp_path)
 
-    @patch("src.tts.synthesizer.synthesize_piper")
-    def test_empty_html_file_handling(self, mock_synthesize):
+    def test_empty_html_file_handling(self):
         """Test handling of empty or near-empty HTML files."""
         html_content = "<html><body></body></html>"
 
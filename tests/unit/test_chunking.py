@@ -27,7 +27,7 @@ class TestChunkSynthesizerInit:
 
             assert chunker.synthesizer is not None
             assert chunker.chunks == []
-            assert chunker.chunk_buffer == []
+            assert len(chunker.chunk_buffer) == 0
             assert chunker.shutdown_event is not None
             assert not chunker.shutdown_event.is_set()
 
@@ -0,0 +1,82 @@
+"""Unit tests for the CLI argument parser.
+
+Tests cover:
+- Subcommand and option parsing
+- Reuse of the parser across parse_args() calls
+"""
+
+import argparse
+import sys
+
+import pytest
+
+from src.cli.parser import create_parser, parse_args
+
+
+@pytest.fixture(scope="module")
+def parser() -> argparse.ArgumentParser:
+    """Build the parser once; the tests only parse with it."""
+    return create_parser()
+
+
+class TestCLIArgumentParsing:
+    """Tests for create_parser()."""
+
+    def test_no_arguments_has_no_command(self, parser: argparse.ArgumentParser) -> None:
+        """Parsing no arguments should leave command unset."""
+        args = parser.parse_args([])
+        assert args.command is None
+        assert args.cli is False
+
+    def test_read_url(self, parser: argparse.ArgumentParser) -> None:
+        """The read subcommand should accept a URL and default the speed."""
+        args = parser.parse_args(["read", "--url", "https://example.com"])
+        assert args.command == "read"
+        assert args.url == "https://example.com"
+        assert args.speed == 1.0
+
+    def test_read_file_uses_filepath_dest(self, parser: argparse.ArgumentParser) -> None:
+        """The read --file option should be stored as filepath."""
+        args = parser.parse_args(["read", "--file", "article.html", "--speed", "1.5"])
+        assert args.filepath == "article.html"
+        assert args.speed == 1.5
+
+    def test_resume_requires_session_id(self, parser: argparse.ArgumentParser) -> None:
+        """The resume subcommand should reject a missing session id."""
+        with pytest.raises(SystemExit):
+            parser.parse_args(["resume"])
+
+
+class TestParseArgs:
+    """Tests for parse_args()."""
+
+    def test_parse_args_reuses_parser(self) -> None:
+        """Repeated calls should give independent namespaces from one parser."""
+        first = parse_args(["config", "--show"])
+        second = parse_args(["list", "--json"])
+
+        assert first.command == "config"
+        assert first.show is True
+        assert second.command == "list"
+        assert not hasattr(second, "show")
+
+    def test_reads_sys_argv_by_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """parse_args() without arguments should parse sys.argv."""
+        monkeypatch.setattr(sys, "argv", ["vox", "delete-session", "abc123"])
+
+        args = parse_args()
+
+        assert args.command == "delete-session"
+        assert args.session_id == "abc123"
+
+    def test_version_flag_displays_version(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """--version should print the version and exit cleanly."""
+        monkeypatch.setattr(sys, "argv", ["vox", "--version"])
+
+        with pytest.raises(SystemExit) as exc_info:
+            parse_args()
+
+        assert exc_info.value.code == 0
+        assert "vox 3.0.0" in capsys.readouterr().out
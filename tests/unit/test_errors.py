@@ -1,5 +1,8 @@
 """Unit tests for custom exception classes."""
 
+import copy
+import pickle
+
 import pytest
 
 from src.utils.errors import (
@@ -44,6 +47,50 @@ class TestvoxExceptionBase:
         assert "url=https://example.com" in error_str
         assert "status=404" in error_str
 
+    def test_exception_attributes_stored_in_slots(self):
+        """Test that structured attributes do not populate the instance dict."""
+        exc = TabNotFoundError("Tab missing", context={"tab_id": 1})
+        assert exc.message == "Tab missing"
+        assert exc.context == {"tab_id": 1}
+        assert vars(exc) == {}
+
+    def test_exception_message_formatted_lazily(self):
+        """Test that the message is formatted on first str() and then reused."""
+        exc = voxException("Lazy", context={"key": "value"})
+        assert exc.args == ("Lazy",)
+        first = str(exc)
+        assert first == "[voxException] Lazy (key=value)"
+        assert str(exc) is first
+
+    def test_exception_without_context_shares_empty_mapping(self):
+        """Test that context-free exceptions share one read-only empty context."""
+        first = voxException("One")
+        second = TabNotFoundError("Two", context={})
+        assert first.context is second.context
+        assert first.context == {}
+        with pytest.raises(TypeError):
+            first.context["key"] = "value"
+
+    def test_default_error_code_is_class_name(self):
+        """Test that each subclass defaults its error code to its own name."""
+        assert TTSInitializationError("x").error_code == "TTSInitializationError"
+        assert TTSError("x").error_code == "TTSError"
+        assert TTSInitializationError._default_error_code == "TTSInitializationError"
+
+    def test_custom_init_is_preserved(self):
+        """Test that subclasses with their own __init__ keep it, including in children."""
+
+        class CustomError(voxException):
+            def __init__(self, tab_id):
+                super().__init__("Custom", context={"tab_id": tab_id})
+
+        class ChildError(CustomError):
+            pass
+
+        exc = ChildError(7)
+        assert exc.error_code == "ChildError"
+        assert exc.context == {"tab_id": 7}
+
     def test_exception_is_subclassed_properly(self):
         """Test that exception inherits from Exception."""
         exc = voxException("Test")
@@ -150,3 +197,57 @@ class TestExceptionRaisingAndCatching:
         assert "[COMPLETE_ERROR]" in error_str
         assert "key1=value1" in error_str
         assert "key2=42" in error_str
+
+
+class TestErrorCodeInterning:
+    """Tests for interning of supplied error codes."""
+
+    def test_equal_codes_share_one_object(self):
+        """Test that dynamically built codes are interned."""
+        prefix = "BACKUP"
+        first = ConfigurationError("a", error_code=prefix + "_FAILED")
+        second = voxException("b", error_code="_".join([prefix, "FAILED"]))
+        assert first.error_code is second.error_code
+
+
+class TestExceptionCopying:
+    """Tests for pickling and copying exceptions with slotted attributes."""
+
+    @pytest.mark.parametrize("clone", [lambda e: pickle.loads(pickle.dumps(e)), copy.copy, copy.deepcopy])
+    def test_clone_keeps_code_and_context(self, clone):
+        """Test that pickle and copy round-trips keep the error code and context."""
+        exc = TabNotFoundError("Tab gone", error_code="C", context={"a": 1})
+
+        restored = clone(exc)
+
+        assert type(restored) is TabNotFoundError
+        assert restored.error_code == "C"
+        assert restored.context == {"a": 1}
+        assert str(restored) == "[C] Tab gone (a=1)"
+
+    def test_clone_without_context(self):
+        """Test that an exception without context round-trips to the shared empty context."""
+        restored = pickle.loads(pickle.dumps(voxException("Oops")))
+
+        assert restored.error_code == "voxException"
+        assert str(restored) == "[voxException] Oops"
+
+
+class TestExceptionFormatting:
+    """Tests for f-string formatting and the short form."""
+
+    def test_format_uses_cached_message(self):
+        """Test that f-strings reuse the lazily built message."""
+        exc = SessionError("Save failed", context={"id": "abc"})
+        assert f"{exc}" == "[SessionError] Save failed (id=abc)"
+        assert f"{exc}" is str(exc)
+
+    def test_format_accepts_spec(self):
+        """Test that format specs apply to the formatted message."""
+        exc = voxException("Oops", error_code="E")
+        assert f"{exc:>12}" == "    [E] Oops"
+
+    def test_short_omits_context(self):
+        """Test short() returns only the code and message."""
+        exc = URLFetchError("Fetch failed", context={"url": "https://example.com"})
+        assert exc.short() == "[URLFetchError] Fetch failed"
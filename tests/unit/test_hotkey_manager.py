@@ -47,6 +47,10 @@ class TestParseHotkey:
         keys = parse_hotkey("ctrl+f1")
         assert len(keys) == 2
 
+    def test_parse_is_cached(self) -> None:
+        """Parsing the same hotkey again should reuse the earlier result."""
+        assert parse_hotkey("ctrl+shift+f5") is parse_hotkey("ctrl+shift+f5")
+
     def test_parse_empty_string_raises(self) -> None:
         """parse_hotkey should raise HotkeyInvalidFormatError for empty string."""
         with pytest.raises(HotkeyInvalidFormatError):
@@ -0,0 +1,105 @@
+"""Unit tests for logging configuration."""
+
+import logging
+
+import pytest
+
+from src.utils.logging import ColoredFormatter, setup_logging
+
+
+class TestSetupLogging:
+    """Tests for setup_logging."""
+
+    @pytest.mark.parametrize(
+        ("level", "expected"),
+        [
+            ("debug", logging.DEBUG),
+            ("WARNING", logging.WARNING),
+            ("warn", logging.WARNING),
+            ("FATAL", logging.CRITICAL),
+            ("bogus", logging.INFO),
+        ],
+    )
+    def test_level_applied_to_logger_only(self, tmp_path, level, expected):
+        """Test that the resolved level is applied to the logger, leaving shared handlers unfiltered."""
+        logger = setup_logging(f"vox.test.level.{level}", level=level, log_file=tmp_path / "test.log")
+        try:
+            assert logger.level == expected
+            assert [handler.level for handler in logger.handlers] == [logging.NOTSET, logging.NOTSET]
+        finally:
+            for handler in logger.handlers:
+                handler.close()
+            logger.handlers.clear()
+
+
+class TestColoredFormatter:
+    """Tests for ColoredFormatter."""
+
+    def _record(self, level: int) -> logging.LogRecord:
+        return logging.LogRecord("vox.test", level, __file__, 1, "hello", None, None)
+
+    def test_colored_levels_match_colors(self):
+        """Test that precomputed level strings wrap each name in its color."""
+        for name, color in ColoredFormatter.COLORS.items():
+            assert ColoredFormatter.COLORED_LEVELS[name] == f"{color}{name}{ColoredFormatter.RESET}"
+
+    def test_format_colors_level_name(self):
+        """Test that the formatted output contains the colored level name."""
+        formatter = ColoredFormatter("%(levelname)s %(message)s")
+
+        output = formatter.format(self._record(logging.WARNING))
+
+        assert output == f"{ColoredFormatter.COLORED_LEVELS['WARNING']} hello"
+
+    def test_format_does_not_mutate_record(self):
+        """Test that the record's level name is restored after formatting."""
+        formatter = ColoredFormatter("%(levelname)s %(message)s")
+        record = self._record(logging.ERROR)
+
+        formatter.format(record)
+        plain = logging.Formatter("%(levelname)s %(message)s").format(record)
+
+        assert record.levelname == "ERROR"
+        assert plain == "ERROR hello"
+
+
+class TestHandlerReuse:
+    """Tests for sharing handlers across setup_logging calls."""
+
+    def test_same_log_file_reuses_file_handler(self, tmp_path):
+        """Test that reconfiguring with the same log file does not open a new handler."""
+        log_file = tmp_path / "shared.log"
+
+        first = setup_logging("vox.test.reuse.a", level="INFO", log_file=log_file, enable_console=False)
+        second = setup_logging("vox.test.reuse.b", level="INFO", log_file=log_file, enable_console=False)
+
+        assert first.handlers[0] is second.handlers[0]
+
+    def test_shared_handler_keeps_each_logger_level(self, tmp_path):
+        """Test that configuring a second logger does not filter the first one's records."""
+        log_file = tmp_path / "levels.log"
+
+        alpha = setup_logging("vox.test.levels.alpha", level="DEBUG", log_file=log_file, enable_console=False)
+        beta = setup_logging("vox.test.levels.beta", level="WARNING", log_file=log_file, enable_console=False)
+        alpha.info("alpha info")
+        beta.info("beta info")
+        alpha.handlers[0].flush()
+
+        contents = log_file.read_text()
+        assert "alpha info" in contents
+        assert "beta info" not in contents
+
+    def test_console_handler_reused(self, tmp_path):
+        """Test that console handlers for the same stream are shared."""
+        first = setup_logging("vox.test.console.a", level="INFO", enable_file=False)
+        second = setup_logging("vox.test.console.b", level="INFO", enable_file=False)
+
+        assert first.handlers[0] is second.handlers[0]
+
+    def test_file_handlers_share_formatter(self, tmp_path):
+        """Test that handlers for different log files use one formatter instance."""
+        first = setup_logging("vox.test.fmt.a", level="INFO", log_file=tmp_path / "a.log", enable_console=False)
+        second = setup_logging("vox.test.fmt.b", level="INFO", log_file=tmp_path / "b.log", enable_console=False)
+
+        assert first.handlers[0] is not second.handlers[0]
+        assert first.handlers[0].formatter is second.handlers[0].formatter
@@ -0,0 +1,189 @@
+"""Unit tests for configuration migration utilities."""
+
+import json
+import os
+
+import pytest
+
+from src.utils.errors import ConfigurationError
+from src.utils.migration import MIGRATION_MARKER, backup_old_config, copy_config_files, migrate_config
+
+
+@pytest.fixture
+def appdata(tmp_path, monkeypatch):
+    """Point the cached APPDATA config directory at a temporary directory."""
+    monkeypatch.setattr("src.utils.migration._VOX_CONFIG_DIR", tmp_path / "vox")
+    return tmp_path
+
+
+class TestMigrateConfig:
+    """Tests for migrate_config."""
+
+    def test_missing_appdata_raises(self, monkeypatch):
+        """Test that a missing APPDATA variable is reported."""
+        monkeypatch.setattr("src.utils.migration._VOX_CONFIG_DIR", None)
+
+        with pytest.raises(ConfigurationError) as exc_info:
+            migrate_config()
+
+        assert exc_info.value.error_code == "APPDATA_NOT_FOUND"
+
+    def test_no_old_config_writes_marker(self, appdata):
+        """Test that a no-op migration records the marker file."""
+        result = migrate_config()
+
+        assert result["migrated"] is False
+        assert (appdata / "vox" / MIGRATION_MARKER).exists()
+
+    def test_existing_config_writes_marker(self, appdata):
+        """Test that an already-present config skips migration and records the marker."""
+        (appdata / "vox").mkdir()
+        (appdata / "vox" / "config.json").write_text("{}")
+
+        result = migrate_config()
+
+        assert result["migrated"] is False
+        assert (appdata / "vox" / MIGRATION_MARKER).exists()
+
+    def test_marker_short_circuits_detection(self, appdata, monkeypatch):
+        """Test that the marker skips old-config detection entirely."""
+        (appdata / "vox").mkdir()
+        (appdata / "vox" / MIGRATION_MARKER).touch()
+
+        def fail_detect():
+            raise AssertionError("detect_old_config should not be called")
+
+        monkeypatch.setattr("src.utils.migration.detect_old_config", fail_detect)
+
+        result = migrate_config()
+
+        assert result["migrated"] is False
+        assert result["message"] == "Configuration migration already completed"
+
+
+class TestBackupOldConfig:
+    """Tests for backup_old_config."""
+
+    def test_backup_hard_links_files(self, tmp_path):
+        """Test that backed-up files share storage with the originals."""
+        old_dir = tmp_path / "vox"
+        (old_dir / "models").mkdir(parents=True)
+        (old_dir / "models" / "model.bin").write_bytes(b"weights")
+
+        backup_dir = backup_old_config(old_dir)
+
+        backup_file = backup_dir / "models" / "model.bin"
+        assert backup_file.read_bytes() == b"weights"
+        assert os.path.samefile(backup_file, old_dir / "models" / "model.bin")
+
+    def test_backup_falls_back_to_copy(self, tmp_path, monkeypatch):
+        """Test that model files are copied when hard links are not supported."""
+        old_dir = tmp_path / "vox"
+        (old_dir / "models").mkdir(parents=True)
+        (old_dir / "models" / "model.bin").write_bytes(b"weights")
+
+        def no_link(src, dst):
+            raise OSError("links not supported")
+
+        monkeypatch.setattr("src.utils.migration.os.link", no_link)
+        backup_dir = backup_old_config(old_dir)
+
+        backup_file = backup_dir / "models" / "model.bin"
+        assert backup_file.read_bytes() == b"weights"
+        assert not os.path.samefile(backup_file, old_dir / "models" / "model.bin")
+
+    def test_backup_unaffected_by_rewriting_originals(self, tmp_path):
+        """Test that config.json and sessions are real copies, not links."""
+        old_dir = tmp_path / "vox"
+        (old_dir / "sessions").mkdir(parents=True)
+        (old_dir / "config.json").write_text('{"hotkey": "ctrl+alt+space"}')
+        (old_dir / "sessions" / "sessions.db").write_bytes(b"rows")
+
+        backup_dir = backup_old_config(old_dir)
+        # save_user_config rewrites config.json in place
+        with open(old_dir / "config.json", "w") as f:
+            f.write('{"hotkey": "CHANGED"}')
+        with open(old_dir / "sessions" / "sessions.db", "wb") as f:
+            f.write(b"changed")
+
+        assert (backup_dir / "config.json").read_text() == '{"hotkey": "ctrl+alt+space"}'
+        assert (backup_dir / "sessions" / "sessions.db").read_bytes() == b"rows"
+
+
+class TestCopyConfigFiles:
+    """Tests for copy_config_files."""
+
+    def test_copies_config_and_directories(self, tmp_path):
+        """Test that config.json, sessions/ and models/ are copied."""
+        old_dir = tmp_path / "old"
+        (old_dir / "sessions").mkdir(parents=True)
+        (old_dir / "models").mkdir()
+        (old_dir / "config.json").write_text(json.dumps({"app_name": "legacy", "speed": 1.5}))
+        (old_dir / "sessions" / "session.json").write_text('{"id": 1}')
+        (old_dir / "models" / "model.bin").write_bytes(b"\x00\x01")
+        new_dir = tmp_path / "new"
+
+        results = copy_config_files(old_dir, new_dir)
+
+        assert results == {"config.json": True, "sessions/": True, "models/": True}
+        assert json.loads((new_dir / "config.json").read_text()) == {"app_name": "vox", "speed": 1.5}
+        assert (new_dir / "sessions" / "session.json").read_text() == '{"id": 1}'
+        assert (new_dir / "models" / "model.bin").read_bytes() == b"\x00\x01"
+
+    def test_config_without_app_name_copied_verbatim(self, tmp_path):
+        """Test that a config without app_name is copied byte for byte."""
+        old_dir = tmp_path / "old"
+        old_dir.mkdir()
+        raw = b'{"speed":1.5,\n "voice": "en_US"}'
+        (old_dir / "config.json").write_bytes(raw)
+        new_dir = tmp_path / "new"
+
+        results = copy_config_files(old_dir, new_dir)
+
+        assert results["config.json"] is True
+        assert (new_dir / "config.json").read_bytes() == raw
+
+    def test_non_object_config_copied_unchanged(self, tmp_path):
+        """Test that a top-level JSON array mentioning app_name is left as is."""
+        old_dir = tmp_path / "old"
+        old_dir.mkdir()
+        (old_dir / "config.json").write_text('["app_name", 1]')
+        new_dir = tmp_path / "new"
+
+        copy_config_files(old_dir, new_dir)
+
+        assert json.loads((new_dir / "config.json").read_text()) == ["app_name", 1]
+
+    def test_invalid_config_with_app_name_raises(self, tmp_path):
+        """Test that an unparseable config needing a rewrite is reported."""
+        old_dir = tmp_path / "old"
+        old_dir.mkdir()
+        (old_dir / "config.json").write_text('{"app_name": ')
+
+        with pytest.raises(ConfigurationError) as exc_info:
+            copy_config_files(old_dir, tmp_path / "new")
+
+        assert exc_info.value.error_code == "CONFIG_COPY_FAILED"
+
+    def test_nested_directories_merged(self, tmp_path):
+        """Test that nested session folders are copied into an existing destination."""
+        old_dir = tmp_path / "old"
+        (old_dir / "sessions" / "2024").mkdir(parents=True)
+        (old_dir / "sessions" / "2024" / "a.json").write_text("a")
+        new_dir = tmp_path / "new"
+        (new_dir / "sessions").mkdir(parents=True)
+        (new_dir / "sessions" / "existing.json").write_text("kept")
+
+        copy_config_files(old_dir, new_dir)
+
+        assert (new_dir / "sessions" / "2024" / "a.json").read_text() == "a"
+        assert (new_dir / "sessions" / "existing.json").read_text() == "kept"
+
+    def test_missing_items_reported_false(self, tmp_path):
+        """Test that absent files and directories are reported as not copied."""
+        old_dir = tmp_path / "old"
+        old_dir.mkdir()
+
+        results = copy_config_files(old_dir, tmp_path / "new")
+
+        assert results == {"config.json": False, "sessions/": False, "models/": False}
@@ -0,0 +1,168 @@
+"""Unit tests for MicrophoneRecorder's persistent ring-buffer stream."""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from src.stt.recorder import MicrophoneRecorder
+from src.utils.errors import MicrophoneError
+
+
+@pytest.fixture
+def recorder():
+    """Create a recorder with an open persistent stream on a mocked device."""
+    with (
+        patch.object(MicrophoneRecorder, "_detect_default_device", return_value=(0, "Test Mic")),
+        patch.object(MicrophoneRecorder, "_validate_device"),
+        patch("src.stt.recorder.sd.InputStream") as mock_stream_class,
+    ):
+        rec = MicrophoneRecorder(sample_rate=10)
+        rec.open_stream(buffer_seconds=1)
+        rec.mock_stream = mock_stream_class.return_value
+        yield rec
+
+
+def as_pcm16(audio: np.ndarray) -> list[int]:
+    """Scale float32 samples returned by stop_recording back to int16 values."""
+    return (audio * 32768).astype(np.int16).tolist()
+
+
+def feed(recorder: MicrophoneRecorder, samples: list[int]) -> None:
+    """Simulate the audio device delivering a chunk of samples."""
+    chunk = np.array(samples, dtype=np.int16).reshape(-1, 1)
+    recorder._ring_callback(chunk, len(chunk), None, None)
+
+
+class TestPersistentStream:
+    """Tests for open_stream, start_recording and stop_recording with a ring buffer."""
+
+    def test_open_stream_starts_device_once(self, recorder: MicrophoneRecorder) -> None:
+        """The stream should start on open and keep running across recordings."""
+        recorder.mock_stream.start.assert_called_once()
+
+        recorder.start_recording()
+        feed(recorder, [1, 2])
+        recorder.stop_recording()
+
+        recorder.mock_stream.stop.assert_not_called()
+        assert recorder.is_stream_open
+
+    def test_recording_returns_only_samples_after_start(self, recorder: MicrophoneRecorder) -> None:
+        """Audio captured before start_recording should not be included."""
+        feed(recorder, [9, 9, 9])
+        recorder.start_recording()
+        feed(recorder, [1, 2, 3])
+
+        audio = recorder.stop_recording()
+
+        assert audio.dtype == np.float32
+        assert as_pcm16(audio) == [1, 2, 3]
+
+    def test_recording_wraps_around_buffer(self, recorder: MicrophoneRecorder) -> None:
+        """Samples spanning the end of the ring should come back in order."""
+        feed(recorder, [0] * 8)
+        recorder.start_recording()
+        feed(recorder, [1, 2, 3, 4])
+
+        assert as_pcm16(recorder.stop_recording()) == [1, 2, 3, 4]
+
+    def test_overrun_drops_oldest_samples(self, recorder: MicrophoneRecorder) -> None:
+        """A recording longer than the buffer keeps only the newest samples."""
+        recorder.start_recording()
+        feed(recorder, list(range(1, 8)))
+        feed(recorder, list(range(8, 15)))
+
+        assert as_pcm16(recorder.stop_recording()) == list(range(5, 15))
+
+    def test_recordings_share_scratch_buffer(self, recorder: MicrophoneRecorder) -> None:
+        """Each recording should be returned as a view of the same preallocated buffer."""
+        recorder.start_recording()
+        feed(recorder, [1, 2, 3])
+        first = recorder.stop_recording()
+
+        recorder.start_recording()
+        feed(recorder, [4, 5])
+        second = recorder.stop_recording()
+
+        assert np.shares_memory(first, second)
+        assert as_pcm16(second) == [4, 5]
+
+    def test_empty_recording_raises(self, recorder: MicrophoneRecorder) -> None:
+        """Stopping before any audio arrived should report no audio."""
+        recorder.start_recording()
+
+        with pytest.raises(MicrophoneError) as exc_info:
+            recorder.stop_recording()
+
+        assert exc_info.value.error_code == "NO_AUDIO_RECORDED"
+
+    def test_level_callback_only_while_recording(self, recorder: MicrophoneRecorder) -> None:
+        """Visual feedback should only be sent during a recording."""
+        callback = MagicMock()
+        recorder.set_audio_callback(callback)
+
+        feed(recorder, [1])
+        callback.assert_not_called()
+
+        recorder.start_recording()
+        feed(recorder, [2])
+        callback.assert_called_once()
+
+    def test_close_stream_stops_device(self, recorder: MicrophoneRecorder) -> None:
+        """close_stream should stop and close the underlying stream."""
+        recorder.close_stream()
+
+        recorder.mock_stream.stop.assert_called_once()
+        recorder.mock_stream.close.assert_called_once()
+        assert not recorder.is_stream_open
+
+
+class TestPeekRecording:
+    """Tests for reading a recording while it is still being captured."""
+
+    def test_peek_returns_samples_so_far(self, recorder: MicrophoneRecorder) -> None:
+        """peek_recording should copy samples after the offset without stopping."""
+        feed(recorder, [9, 9])
+        recorder.start_recording()
+        feed(recorder, [1, 2, 3])
+
+        assert recorder.peek_recording().tolist() == [1, 2, 3]
+        assert recorder.peek_recording(2).tolist() == [3]
+        assert recorder.is_recording
+
+    def test_peek_empty_when_not_recording(self, recorder: MicrophoneRecorder) -> None:
+        """There is nothing to peek at outside a recording."""
+        feed(recorder, [1, 2])
+
+        assert len(recorder.peek_recording()) == 0
+
+    def test_recorded_samples_counts_dropped_audio(self, recorder: MicrophoneRecorder) -> None:
+        """recorded_samples should include samples the ring buffer overwrote."""
+        recorder.start_recording()
+        feed(recorder, list(range(1, 7)))
+        feed(recorder, list(range(7, 13)))
+        audio = recorder.stop_recording()
+        feed(recorder, [0, 0])
+
+        assert recorder.recorded_samples == 12
+        assert len(audio) == 10
+
+
+class TestSaveWav:
+    """Tests for writing recordings to disk."""
+
+    def test_float32_saved_as_pcm16(self, recorder: MicrophoneRecorder, tmp_path) -> None:
+        """float32 recordings should be written as 16-bit PCM."""
+        from scipy.io import wavfile
+
+        recorder.start_recording()
+        feed(recorder, [1, -2, 32767, -32768])
+        path = tmp_path / "out.wav"
+
+        recorder.save_wav(recorder.stop_recording(), path)
+
+        rate, data = wavfile.read(path)
+        assert rate == 10
+        assert data.dtype == np.int16
+        assert data.reshape(-1).tolist() == [1, -2, 32767, -32768]
@@ -0,0 +1,106 @@
+"""Unit tests for StreamingDecoder."""
+
+import threading
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.stt.streaming import StreamingDecoder
+
+
+@pytest.fixture
+def recorder() -> MagicMock:
+    """Create a recorder mock at 10Hz with 50 samples captured so far."""
+    rec = MagicMock()
+    rec.sample_rate = 10
+    rec.audio = np.arange(50, dtype=np.int16)
+    rec.peek_recording.side_effect = lambda offset=0: rec.audio[offset:]
+    rec.recorded_samples = 50
+    return rec
+
+
+@pytest.fixture
+def engine() -> MagicMock:
+    """Create an STT engine mock."""
+    stt = MagicMock()
+    stt.transcribe_partial.return_value = [(2.0, "Hello"), (4.0, "there"), (5.0, "wor")]
+    stt.transcribe_array.return_value = "world"
+    return stt
+
+
+class TestStreamingDecoder:
+    """Tests for committing partial decodes and finishing the tail."""
+
+    def test_commits_all_but_last_segment(self, engine: MagicMock, recorder: MagicMock) -> None:
+        """The last segment may be incomplete, so only the audio before it is committed."""
+        decoder = StreamingDecoder(engine, recorder, interval=1.0, window=30.0)
+        decoder._decode_step()
+
+        text = decoder.finish(recorder.audio)
+
+        assert text == "Hello there world"
+        tail = engine.transcribe_array.call_args[0][0]
+        assert tail.tolist() == list(range(40, 50))
+
+    def test_window_commits_whole_decode(self, engine: MagicMock, recorder: MagicMock) -> None:
+        """Once the uncommitted audio reaches the window, every segment is committed."""
+        decoder = StreamingDecoder(engine, recorder, interval=1.0, window=5.0)
+        decoder._decode_step()
+
+        assert decoder._offset == 50
+        assert decoder._committed == ["Hello", "there", "wor"]
+
+    def test_short_audio_not_decoded(self, engine: MagicMock, recorder: MagicMock) -> None:
+        """Less than one interval of new audio should wait for the next step."""
+        recorder.audio = np.arange(5, dtype=np.int16)
+        decoder = StreamingDecoder(engine, recorder, interval=1.0)
+
+        decoder._decode_step()
+
+        engine.transcribe_partial.assert_not_called()
+
+    def test_finish_without_commits_transcribes_everything(self, engine: MagicMock, recorder: MagicMock) -> None:
+        """With nothing committed, finish should transcribe the full recording."""
+        decoder = StreamingDecoder(engine, recorder, interval=60.0)
+        decoder.start()
+
+        assert decoder.finish(recorder.audio) == "world"
+        engine.transcribe_array.assert_called_once_with(recorder.audio, 10, language="en")
+
+    def test_finish_accounts_for_dropped_samples(self, engine: MagicMock, recorder: MagicMock) -> None:
+        """A recording that outgrew the ring buffer should still resume at the commit point."""
+        decoder = StreamingDecoder(engine, recorder, interval=1.0, window=30.0)
+        decoder._decode_step()
+        recorder.recorded_samples = 60
+
+        # stop_recording kept only the newest 40 of 60 samples
+        decoder.finish(np.arange(20, 60, dtype=np.int16))
+
+        tail = engine.transcribe_array.call_args[0][0]
+        assert tail.tolist() == list(range(40, 60))
+
+    def test_cancel_waits_for_decode_in_progress(self, engine: MagicMock, recorder: MagicMock) -> None:
+        """cancel() should return only once a running partial decode has finished."""
+        decoding = threading.Event()
+        release = threading.Event()
+
+        def slow_partial(*args, **kwargs):
+            decoding.set()
+            release.wait()
+            return []
+
+        engine.transcribe_partial.side_effect = slow_partial
+        decoder = StreamingDecoder(engine, recorder, interval=0.01)
+        decoder.start()
+        assert decoding.wait(5)
+
+        canceller = threading.Thread(target=decoder.cancel)
+        canceller.start()
+        canceller.join(0.1)
+        assert canceller.is_alive()
+
+        release.set()
+        canceller.join(5)
+        assert not canceller.is_alive()
+        assert not decoder._thread.is_alive()
@@ -0,0 +1,71 @@
+"""Unit tests for STTEngine in-memory transcription."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from src.stt.engine import STTEngine
+from src.utils.errors import TranscriptionError
+
+
+@pytest.fixture
+def engine() -> STTEngine:
+    """Create an STTEngine with a mocked Whisper model."""
+    with patch.object(STTEngine, "_load_model"):
+        stt = STTEngine("tiny")
+    stt.model = MagicMock()
+    stt.model.transcribe.return_value = (
+        iter([SimpleNamespace(text=" Hello "), SimpleNamespace(text="world ")]),
+        SimpleNamespace(language="en", language_probability=0.99),
+    )
+    return stt
+
+
+class TestTranscribeArray:
+    """Tests for STTEngine.transcribe_array."""
+
+    def test_int16_samples_passed_as_float32(self, engine: STTEngine) -> None:
+        """int16 PCM should be scaled to float32 in [-1, 1] without a temp file."""
+        samples = np.array([0, 16384, -32768], dtype=np.int16)
+
+        text = engine.transcribe_array(samples, 16000)
+
+        assert text == "Hello world"
+        audio = engine.model.transcribe.call_args[0][0]
+        assert audio.dtype == np.float32
+        np.testing.assert_allclose(audio, [0.0, 0.5, -1.0])
+
+    def test_resamples_to_16khz(self, engine: STTEngine) -> None:
+        """Audio at another rate should be resampled to 16kHz."""
+        samples = np.zeros(48000, dtype=np.float32)
+
+        engine.transcribe_array(samples, 48000)
+
+        audio = engine.model.transcribe.call_args[0][0]
+        assert len(audio) == 16000
+
+    def test_model_failure_raises_transcription_error(self, engine: STTEngine) -> None:
+        """Model errors should surface as TranscriptionError."""
+        engine.model.transcribe.side_effect = RuntimeError("boom")
+
+        with pytest.raises(TranscriptionError) as exc_info:
+            engine.transcribe_array(np.zeros(10, dtype=np.int16), 16000)
+
+        assert exc_info.value.error_code == "TRANSCRIPTION_FAILED"
+
+
+class TestTranscribePartial:
+    """Tests for STTEngine.transcribe_partial."""
+
+    def test_returns_segment_end_times(self, engine: STTEngine) -> None:
+        """Each segment should come back with its end time for committing."""
+        engine.model.transcribe.return_value = (
+            iter([SimpleNamespace(end=1.2, text=" Hello "), SimpleNamespace(end=2.0, text="wor")]),
+            SimpleNamespace(language="en", language_probability=0.99),
+        )
+
+        segments = engine.transcribe_partial(np.zeros(32000, dtype=np.int16), 16000)
+
+        assert segments == [(1.2, "Hello"), (2.0, "wor")]
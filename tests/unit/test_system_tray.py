@@ -0,0 +1,134 @@
+"""Unit tests for SystemTrayManager.
+
+Tests verify that:
+- The tray icon file is located and decoded only once per process
+- The fallback icon is used when no icon file exists
+- Menu handlers update visibility and invoke callbacks
+"""
+
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PIL import Image
+
+from src.ui.system_tray import SystemTrayManager
+
+
+@pytest.fixture(autouse=True)
+def clear_icon_cache():
+    """Reset the cached tray icons between tests."""
+    SystemTrayManager._cached_icon.cache_clear()
+    SystemTrayManager._FALLBACK_ICON = None
+    yield
+    SystemTrayManager._cached_icon.cache_clear()
+    SystemTrayManager._FALLBACK_ICON = None
+
+
+class TestIconLoading:
+    """Tests for tray icon image loading."""
+
+    def test_icon_file_loaded_once(self, tmp_path, monkeypatch) -> None:
+        """Verify the icon file is opened once across repeated loads."""
+        (tmp_path / "imgs").mkdir()
+        Image.new("RGB", (16, 16), (255, 0, 0)).save(tmp_path / "imgs" / "vox.ico")
+        monkeypatch.chdir(tmp_path)
+        manager = SystemTrayManager()
+
+        with patch("src.ui.system_tray.Image.open", wraps=Image.open) as mock_open:
+            first = manager._load_icon_image()
+            second = SystemTrayManager()._load_icon_image()
+
+        assert mock_open.call_count == 1
+        assert first.size == (16, 16)
+        assert first is not second
+
+    def test_fallback_used_without_icon_file(self, tmp_path, monkeypatch) -> None:
+        """Verify a fallback icon is created when no icon file exists."""
+        monkeypatch.chdir(tmp_path)
+        manager = SystemTrayManager()
+
+        image = manager._load_icon_image()
+
+        assert image.size == (64, 64)
+
+    def test_fallback_icon_is_shared(self, tmp_path, monkeypatch) -> None:
+        """Verify the fallback icon is drawn once and shared across instances."""
+        monkeypatch.chdir(tmp_path)
+
+        first = SystemTrayManager()._load_icon_image()
+        second = SystemTrayManager()._load_icon_image()
+
+        assert first is second
+
+    def test_fallback_icon_draws_white_v(self) -> None:
+        """Verify the fallback icon is primary blue with a white V stroke."""
+        image = SystemTrayManager._create_fallback_icon()
+
+        assert image.mode == "RGB"
+        assert image.getpixel((0, 0)) == (69, 130, 236)
+        assert image.getpixel((12, 12)) == (255, 255, 255)
+        assert image.getpixel((32, 52)) == (255, 255, 255)
+        assert image.getpixel((52, 12)) == (255, 255, 255)
+        assert image.getpixel((32, 12)) == (69, 130, 236)
+
+    def test_first_existing_path_wins(self, tmp_path, monkeypatch) -> None:
+        """Verify the search stops at the first existing icon file."""
+        (tmp_path / "build" / "resources").mkdir(parents=True)
+        (tmp_path / "imgs").mkdir()
+        Image.new("RGB", (32, 32)).save(tmp_path / "build" / "resources" / "vox.ico")
+        Image.new("RGB", (16, 16)).save(tmp_path / "imgs" / "vox.ico")
+        monkeypatch.chdir(tmp_path)
+
+        with patch("src.ui.system_tray.os.path.isfile", wraps=os.path.isfile) as mock_isfile:
+            image = SystemTrayManager()._load_icon_image()
+
+        assert image.size == (32, 32)
+        assert mock_isfile.call_count == 1
+
+
+class TestMenuHandlers:
+    """Tests for tray menu handlers."""
+
+    def test_show_invokes_callback(self) -> None:
+        """Verify Show marks the window visible and calls on_show."""
+        on_show = MagicMock()
+        manager = SystemTrayManager(on_show=on_show)
+        manager.update_menu_state(False)
+
+        manager._handle_show(MagicMock(), MagicMock())
+
+        assert manager._is_visible is True
+        on_show.assert_called_once_with()
+
+    def test_hide_invokes_callback(self) -> None:
+        """Verify Hide marks the window hidden and calls on_hide."""
+        on_hide = MagicMock()
+        manager = SystemTrayManager(on_hide=on_hide)
+
+        manager._handle_hide(MagicMock(), MagicMock())
+
+        assert manager._is_visible is False
+        on_hide.assert_called_once_with()
+
+    def test_exit_stops_icon_and_invokes_callback(self) -> None:
+        """Verify Exit stops the icon and calls on_exit."""
+        on_exit = MagicMock()
+        manager = SystemTrayManager(on_exit=on_exit)
+        icon = MagicMock()
+        manager._icon = icon
+
+        manager._handle_exit(MagicMock(), MagicMock())
+
+        icon.stop.assert_called_once_with()
+        on_exit.assert_called_once_with()
+
+    def test_handlers_without_callbacks(self) -> None:
+        """Verify handlers work when no callbacks are provided."""
+        manager = SystemTrayManager()
+
+        manager._handle_show(MagicMock(), MagicMock())
+        manager._handle_hide(MagicMock(), MagicMock())
+        manager._handle_exit(MagicMock(), MagicMock())
+
+        assert manager._is_visible is False
@@ -0,0 +1,168 @@
+"""Unit tests for UI component mixins.
+
+Tests verify that:
+- StateMixin stores state apart from instance attributes and notifies listeners on change
+- Slotted components keep state without a per-instance __dict__
+- ValidationMixin reports errors for empty and out-of-range values
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.ui.mixins.base_component import BaseComponent
+
+
+class SlottedComponent(BaseComponent):
+    """Component declaring empty slots, so it has no per-instance __dict__."""
+
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        self.init_state({"loading": False, "recording": False})
+
+
+class DynamicComponent(BaseComponent):
+    """Component without declared slots, accepting arbitrary state keys."""
+
+
+class RecordingComponent(BaseComponent):
+    """Component capturing validation errors."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.errors: list[str] = []
+
+    def _show_validation_error(self, message: str) -> None:
+        self.errors.append(message)
+
+
+class TestStateMixin:
+    """Tests for StateMixin state management."""
+
+    def test_initial_state_is_readable(self) -> None:
+        """Verify initial state values are returned by get_state."""
+        component = SlottedComponent()
+
+        assert component.get_state("loading") is False
+
+    def test_get_state_returns_default_for_missing_key(self) -> None:
+        """Verify get_state falls back to the default for unknown keys."""
+        component = BaseComponent()
+
+        assert component.get_state("missing", "fallback") == "fallback"
+
+    def test_state_keys_do_not_shadow_attributes(self) -> None:
+        """Verify state keys named like methods neither replace nor leak them."""
+        component = DynamicComponent()
+
+        component.set_state("init_state", "value")
+
+        assert callable(component.init_state)
+        assert component.get_state("init_state") == "value"
+        assert component.get_state("set_state", "fallback") == "fallback"
+
+    def test_slotted_component_has_no_dict(self) -> None:
+        """Verify components declaring slots do not allocate a __dict__."""
+        component = SlottedComponent()
+
+        assert not hasattr(component, "__dict__")
+
+    def test_set_state_notifies_listener_on_change(self) -> None:
+        """Verify listeners are called with the new value when state changes."""
+        component = SlottedComponent()
+        listener = MagicMock()
+        component.on_state_change("loading", listener)
+
+        component.set_state("loading", True)
+
+        assert component.get_state("loading") is True
+        listener.assert_called_once_with(True)
+
+    def test_set_state_skips_listener_when_unchanged(self) -> None:
+        """Verify listeners are not called when the value is unchanged."""
+        component = SlottedComponent()
+        listener = MagicMock()
+        component.on_state_change("recording", listener)
+
+        component.set_state("recording", False)
+
+        listener.assert_not_called()
+
+    def test_set_state_skips_equality_for_same_object(self) -> None:
+        """Verify re-setting the identical object does not compare or notify."""
+        component = DynamicComponent()
+        items = MagicMock()
+        component.set_state("items", items)
+        items.reset_mock()
+        listener = MagicMock()
+        component.on_state_change("items", listener)
+
+        component.set_state("items", items)
+
+        items.__ne__.assert_not_called()
+        listener.assert_not_called()
+
+    def test_set_state_none_on_new_key_does_not_notify(self) -> None:
+        """Verify setting None on an unset key stores it without notifying."""
+        component = DynamicComponent()
+        listener = MagicMock()
+        component.on_state_change("error", listener)
+
+        component.set_state("error", None)
+
+        assert component.get_state("error", "unset") is None
+        listener.assert_not_called()
+
+    def test_listeners_called_in_registration_order(self) -> None:
+        """Verify multiple listeners are invoked in the order registered."""
+        component = SlottedComponent()
+        calls: list[str] = []
+        component.on_state_change("loading", lambda value: calls.append("first"))
+        component.on_state_change("loading", lambda value: calls.append("second"))
+
+        component.set_state("loading", True)
+
+        assert calls == ["first", "second"]
+
+
+class TestValidationMixin:
+    """Tests for ValidationMixin helpers."""
+
+    @pytest.mark.parametrize("value", ["", "   "])
+    def test_validate_not_empty_rejects_blank(self, value: str) -> None:
+        """Verify blank strings fail validation with a field-specific message."""
+        component = RecordingComponent()
+
+        assert component.validate_not_empty(value, "Hotkey") is False
+        assert component.errors == ["Hotkey cannot be empty"]
+
+    def test_validate_not_empty_accepts_text(self) -> None:
+        """Verify non-blank strings pass validation."""
+        component = RecordingComponent()
+
+        assert component.validate_not_empty("ctrl+alt+space", "Hotkey") is True
+        assert component.errors == []
+
+    def test_validate_in_range_rejects_out_of_range(self) -> None:
+        """Verify values outside the range fail validation."""
+        component = RecordingComponent()
+
+        assert component.validate_in_range(3.5, 0.5, 2.0, "Speed") is False
+        assert component.errors == ["Speed must be between 0.5 and 2.0"]
+
+    def test_validate_in_range_accepts_bounds(self) -> None:
+        """Verify inclusive bounds pass validation."""
+        component = RecordingComponent()
+
+        assert component.validate_in_range(0.5, 0.5, 2.0, "Speed") is True
+        assert component.validate_in_range(2.0, 0.5, 2.0, "Speed") is True
+
+    def test_validation_messages_are_reused(self) -> None:
+        """Verify repeated failures reuse the same rendered message."""
+        component = RecordingComponent()
+
+        component.validate_in_range(9.0, 0.5, 2.0, "Speed")
+        component.validate_in_range(8.0, 0.5, 2.0, "Speed")
+
+        assert component.errors[0] is component.errors[1]
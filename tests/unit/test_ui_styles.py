@@ -7,16 +7,27 @@ Tests verify that:
 - Theme switching functions work correctly
 """
 
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
 from src.ui.styles import (
     COLORS_DARK,
     COLORS_LIGHT,
     FONT_FAMILY,
     FONTS,
+    ICON_RECORD,
+    ICON_STOP,
     ICONS,
     SPACING,
     THEMES,
+    configure_fluent_overrides,
+    configure_styles,
     get_colors,
+    get_colors_readonly,
     get_current_theme,
+    switch_theme,
 )
 
 
@@ -159,6 +170,26 @@ class TestColorPalettes:
         assert get_colors("dark") == COLORS_DARK
         assert get_colors("invalid") == COLORS_LIGHT  # defaults to light
 
+    def test_get_colors_returns_shared_palette(self) -> None:
+        """Verify get_colors returns the module-level palette without copying."""
+        assert get_colors("light") is COLORS_LIGHT
+        assert get_colors("dark") is COLORS_DARK
+
+    def test_get_colors_readonly_is_immutable(self) -> None:
+        """Verify get_colors_readonly returns a cached, read-only view."""
+        colors = get_colors_readonly("dark")
+
+        assert colors == COLORS_DARK
+        assert get_colors_readonly("dark") is colors
+        with pytest.raises(TypeError):
+            colors["primary"] = "#000000"  # type: ignore[index]
+
+    @pytest.mark.parametrize("palette", [COLORS_LIGHT, COLORS_DARK, FONTS, SPACING, ICONS, THEMES])
+    def test_style_constants_are_read_only(self, palette) -> None:
+        """Verify module-level style constants cannot be mutated."""
+        with pytest.raises(TypeError):
+            palette["new_key"] = "value"
+
 
 class TestThemes:
     """Tests for theme configuration."""
@@ -178,6 +209,101 @@ class TestThemes:
         theme = get_current_theme()
         assert theme in ["light", "dark"]
 
+    def test_switch_theme_stores_theme_on_window(self) -> None:
+        """Verify switch_theme records the theme on the window it switches."""
+        root = SimpleNamespace(style=MagicMock())
+        other = SimpleNamespace(style=MagicMock())
+
+        switch_theme(root, "dark")
+        switch_theme(other, "light")
+
+        assert get_current_theme(root) == "dark"
+        assert get_current_theme(other) == "light"
+        root.style.theme_use.assert_any_call("darkly")
+
+    def test_switch_theme_invalid_defaults_to_light(self) -> None:
+        """Verify an invalid theme is stored as light."""
+        root = SimpleNamespace(style=MagicMock())
+
+        switch_theme(root, "neon")
+
+        assert get_current_theme(root) == "light"
+
+
+class TestFluentOverrides:
+    """Tests for precomputed Fluent Design style overrides."""
+
+    def test_overrides_use_theme_colors(self) -> None:
+        """Verify overrides configure styles with the requested palette."""
+        style = MagicMock()
+
+        configure_fluent_overrides(style, "dark")
+
+        style.configure.assert_any_call(
+            "Accent.TButton",
+            background=COLORS_DARK["primary"],
+            foreground=COLORS_DARK["on_accent"],
+            padding=(SPACING["lg"], SPACING["md"]),
+            font=(FONT_FAMILY, 12, "bold"),
+        )
+
+    def test_overrides_batch_maps_into_single_call(self) -> None:
+        """Verify all state maps are applied through one theme_settings call."""
+        style = MagicMock()
+        style.theme_use.return_value = "cosmo"
+
+        configure_fluent_overrides(style, "light")
+
+        style.map.assert_not_called()
+        style.theme_settings.assert_called_once()
+        theme_name, settings = style.theme_settings.call_args.args
+        assert theme_name == "cosmo"
+        assert "TNotebook.Tab" in settings
+
+    def test_overrides_later_maps_replace_earlier(self) -> None:
+        """Verify the disabled TButton mapping wins over the hover mapping."""
+        style = MagicMock()
+
+        configure_fluent_overrides(style, "light")
+
+        settings = style.theme_settings.call_args.args[1]
+        button_map = settings["TButton"]["map"]
+        assert button_map["background"] == (("disabled", COLORS_LIGHT["disabled_bg"]),)
+        assert button_map["focuscolor"] == (("focus", COLORS_LIGHT["accent"]),)
+
+    def test_overrides_invalid_theme_defaults_to_light(self) -> None:
+        """Verify an unknown theme falls back to the light overrides."""
+        light_style = MagicMock()
+        light_style.theme_use.return_value = "cosmo"
+        invalid_style = MagicMock()
+        invalid_style.theme_use.return_value = "cosmo"
+
+        configure_fluent_overrides(light_style, "light")
+        configure_fluent_overrides(invalid_style, "invalid")
+
+        assert light_style.method_calls == invalid_style.method_calls
+
+
+class TestConfigureStyles:
+    """Tests for custom label and frame styles."""
+
+    def test_label_styles_use_theme_palette(self) -> None:
+        """Verify label styles get fonts and foreground from the theme."""
+        style = MagicMock()
+
+        configure_styles(style, "dark")
+
+        style.configure.assert_any_call("Title.TLabel", font=FONTS["title"], foreground=COLORS_DARK["foreground"])
+        style.configure.assert_any_call("Caption.TLabel", font=FONTS["caption"], foreground=COLORS_DARK["muted"])
+
+    def test_status_label_styles_only_set_foreground(self) -> None:
+        """Verify status indicator styles leave the font untouched."""
+        style = MagicMock()
+
+        configure_styles(style, "light")
+
+        style.configure.assert_any_call("Danger.TLabel", foreground=COLORS_LIGHT["danger"])
+
 
 class TestIcons:
     """Tests for icon definitions."""
@@ -200,6 +326,11 @@ class TestIcons:
         for icon in required_icons:
             assert icon in ICONS, f"ICONS missing required entry: {icon}"
 
+    def test_recording_icon_constants_match_icons(self) -> None:
+        """Verify pre-bound recording icons mirror the ICONS entries."""
+        assert ICON_RECORD == ICONS["record"]
+        assert ICON_STOP == ICONS["stop"]
+
     def test_icons_are_single_emoji_or_symbol(self) -> None:
         """Verify icons are emoji or unicode symbols (short strings)."""
         for name, icon in ICONS.items():